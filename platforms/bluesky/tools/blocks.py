@@ -1,28 +1,119 @@
 """Block management tools for user-specific memory blocks."""
+import copy
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+# Parsed YAML configs keyed by path, each stored with the (mtime, size) it was read at
+_YAML_CACHE: "OrderedDict[str, Tuple[Tuple[float, int], Any]]" = OrderedDict()
+_YAML_CACHE_MAXSIZE = 16
+
+
+def _load_yaml_cached(path):
+    """
+    Load a YAML file, reusing the parsed result while its mtime and size are unchanged.
+
+    Returns a deep copy so callers cannot mutate the cached data.
+    """
+    import yaml
+
+    key = os.path.abspath(str(path))
+    stat = path.stat()
+    signature = (stat.st_mtime, stat.st_size)
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[1])
+
+    with open(path, 'r') as f:
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+    _YAML_CACHE[key] = (signature, data)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAXSIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+# Marks a LettaClientSpec timeout that was never given, as opposed to an explicit None
+_UNSET = object()
+
+
+@dataclass(slots=True, frozen=True)
+class LettaClientSpec:
+    """Constructor arguments for a Letta client."""
+    token: str
+    timeout: Any = _UNSET
+    base_url: Optional[str] = None
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        """Return the arguments to pass to Letta: timeout whenever given (even None), base_url only when set."""
+        kwargs = {'token': self.token}
+        if self.timeout is not _UNSET:
+            kwargs['timeout'] = self.timeout
+        if self.base_url:
+            kwargs['base_url'] = self.base_url
+        return kwargs
+
+
+# Letta clients keyed by (constructor id, spec), each stored with its constructor;
+# a changed config yields a new spec and so a new client
+_CLIENT_CACHE: "OrderedDict[Tuple[int, LettaClientSpec], Tuple[Any, Any]]" = OrderedDict()
+_CLIENT_CACHE_MAXSIZE = 4
+_CLIENT_LOCK = threading.Lock()
+
+
+def _cached_client(factory, spec: LettaClientSpec):
+    """
+    Return the client ``factory`` builds for ``spec``, constructing it once per spec.
+
+    The lock keeps concurrent first calls from building two clients; a
+    failing constructor raises here and nothing is cached.
+    """
+    key = (id(factory), spec)
+    with _CLIENT_LOCK:
+        cached = _CLIENT_CACHE.get(key)
+        if cached is not None and cached[0] is factory:
+            _CLIENT_CACHE.move_to_end(key)
+            return cached[1]
+
+        client = factory(**spec.as_kwargs())
+        _CLIENT_CACHE[key] = (factory, client)
+        _CLIENT_CACHE.move_to_end(key)
+        while len(_CLIENT_CACHE) > _CLIENT_CACHE_MAXSIZE:
+            _CLIENT_CACHE.popitem(last=False)
+        return client
+
 
 def get_letta_client():
-    """Get a Letta client using configuration."""
+    """Get a Letta client using configuration (reused while the configuration is unchanged)."""
     try:
         from core.config import get_letta_config
         from letta_client import Letta
         config = get_letta_config()
-        client_params = {
-            'token': config['api_key'],
-            'timeout': config['timeout']
-        }
-        if config.get('base_url'):
-            client_params['base_url'] = config['base_url']
-        return Letta(**client_params)
+        spec = LettaClientSpec(
+            token=config['api_key'],
+            timeout=config['timeout'],
+            base_url=config.get('base_url') or None
+        )
+        return _cached_client(Letta, spec)
     except (ImportError, FileNotFoundError, KeyError):
         # Fallback to environment variable
         import os
         from letta_client import Letta
-        return Letta(token=os.environ["LETTA_API_KEY"])
+        return _cached_client(Letta, LettaClientSpec(token=os.environ["LETTA_API_KEY"]))
 
-def get_x_letta_client():
-    """Get a Letta client using X configuration."""
+def get_x_letta_client(_loader=_load_yaml_cached):
+    """
+    Get a Letta client using X configuration (reused while the configuration is unchanged).
+
+    ``_loader`` parses config/platforms.yaml; tests may pass a stub in its place.
+    """
     try:
         import yaml
         from pathlib import Path
@@ -34,17 +125,15 @@ def get_x_letta_client():
             # Fall back to regular client if config/platforms.yaml doesn't exist
             return get_letta_client()
 
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _loader(config_path)
 
         letta_config = config.get('letta', {})
-        client_params = {
-            'token': letta_config['api_key'],
-            'timeout': letta_config.get('timeout', 600)
-        }
-        if letta_config.get('base_url'):
-            client_params['base_url'] = letta_config['base_url']
-        return Letta(**client_params)
+        spec = LettaClientSpec(
+            token=letta_config['api_key'],
+            timeout=letta_config.get('timeout', 600),
+            base_url=letta_config.get('base_url') or None
+        )
+        return _cached_client(Letta, spec)
     except (ImportError, FileNotFoundError, KeyError, yaml.YAMLError):
         # Fall back to regular client
         return get_letta_client()
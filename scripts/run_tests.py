@@ -22,9 +22,9 @@ def run_tests(test_type="all", verbose=False, coverage=True, parallel=False):
     if coverage:
         cmd.extend(["--cov=.", "--cov-report=html", "--cov-report=term-missing"])
     
-    # Add parallel execution
+    # Add parallel execution; loadfile keeps module/class-scoped fixtures on one worker
     if parallel:
-        cmd.extend(["-n", "auto"])
+        cmd.extend(["-n", "auto", "--dist", "loadfile"])
     
     # Add test type filter
     if test_type == "unit":
@@ -33,6 +33,9 @@ def run_tests(test_type="all", verbose=False, coverage=True, parallel=False):
         cmd.extend(["tests/integration", "-m", "integration"])
     elif test_type == "e2e":
         cmd.extend(["tests/e2e", "-m", "e2e"])
+    elif test_type == "fast":
+        # Cheap tier: stop at the first failure and re-run last failures first
+        cmd.extend(["tests/", "-m", "fast and not slow", "-x", "--lf"])
     elif test_type == "all":
         cmd.append("tests/")
     else:
@@ -84,7 +87,7 @@ def main():
     parser = argparse.ArgumentParser(description="Void Bot Test Runner")
     parser.add_argument(
         "--type", 
-        choices=["unit", "integration", "e2e", "all"], 
+        choices=["unit", "integration", "e2e", "fast", "all"], 
         default="all",
         help="Type of tests to run"
     )
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for the Bluesky tool unit tests.
+"""
+from types import MappingProxyType
+
+import pytest
+import responses
+
+BLUESKY_ENV = MappingProxyType({
+    'BSKY_USERNAME': 'test.user.bsky.social',
+    'BSKY_PASSWORD': 'test_password',
+    'PDS_URI': 'https://bsky.social',
+})
+
+BLUESKY_SESSION_URL = f"{BLUESKY_ENV['PDS_URI']}/xrpc/com.atproto.server.createSession"
+
+BLUESKY_SESSION_JSON = {
+    'accessJwt': 'test_token',
+    'did': 'test_did',
+    'handle': 'test.user.bsky.social',
+}
+
+
+@pytest.fixture
+def bluesky_env(monkeypatch):
+    """Set the Bluesky credentials the tools read from the environment for one test.
+
+    ``monkeypatch`` restores the previous environment afterwards, so the fake
+    credentials never leak into tests that check missing-credential handling.
+    Tests that need them missing delete them with the same ``monkeypatch``.
+    """
+    for name, value in BLUESKY_ENV.items():
+        monkeypatch.setenv(name, value)
+    return BLUESKY_ENV
+
+
+@pytest.fixture
+def bluesky_http():
+    """Serve Bluesky XRPC calls from a ``responses`` registry seeded with a valid session.
+
+    Tests ``add``/``replace`` the endpoints they exercise and inspect what
+    the tool sent through ``bluesky_http.calls``. Responses are serialized,
+    so the tool always decodes a fresh copy of any shared payload.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.POST, BLUESKY_SESSION_URL, json=BLUESKY_SESSION_JSON)
+        yield rsps
@@ -1,8 +1,14 @@
 """
 Unit tests for tool_manager.py
 """
+import argparse
+import functools
+import sys
+from io import StringIO
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+import tool_manager
 from tool_manager import (
     ensure_platform_tools, 
     get_attached_tools,
@@ -11,6 +17,29 @@ from tool_manager import (
     COMMON_TOOLS
 )
 
+# Parser mirroring tool_manager.main(), built once for the whole module
+_CACHED_PARSER = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
+_CACHED_PARSER.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
+_CACHED_PARSER.add_argument("--agent-id", help="Agent ID (default: from config)")
+_CACHED_PARSER.add_argument("--list", action="store_true", help="List current tools without making changes")
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(argv):
+    """Parse an argv tuple with the shared parser, once per distinct argv.
+
+    The returned Namespace is shared between tests, so treat it as read-only.
+    """
+    return _CACHED_PARSER.parse_args(list(argv))
+
+
+# Platform indicator per tool, mirroring the --list output of tool_manager.main()
+_TOOL_TAGS = (
+    {tool: " [Bluesky]" for tool in BLUESKY_TOOLS}
+    | {tool: " [X]" for tool in X_TOOLS}
+    | {tool: " [Common]" for tool in COMMON_TOOLS}
+)
+
 
 class TestToolManager:
     """Test cases for tool_manager module."""
@@ -587,7 +616,7 @@ class TestToolManagerCLI:
     """Test cases for tool_manager CLI functionality."""
     
     @patch('tool_manager.get_attached_tools')
-    def test_cli_list_tools(self, mock_get_attached_tools):
+    def test_cli_list_tools(self, mock_get_attached_tools, capsys):
         """Test CLI list functionality."""
         # Mock attached tools
         mock_get_attached_tools.return_value = {
@@ -596,45 +625,20 @@ class TestToolManagerCLI:
             'halt_activity'
         }
         
-        # Test CLI list command
-        import sys
-        from io import StringIO
-        
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
-        
         try:
             # Simulate CLI call
-            import tool_manager
             sys.argv = ['tool_manager.py', '--list']
             # Execute the CLI code directly since there's no main() function
-            import argparse
-            parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-            parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-            parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-            parser.add_argument("--list", action="store_true", help="List current tools without making changes")
-            
-            args = parser.parse_args(['--list'])
+            args = _parse(('--list',))
             
             if args.list:
                 tools = tool_manager.get_attached_tools(args.agent_id)
-                print(f"\nCurrently attached tools ({len(tools)}):")
-                for tool in sorted(tools):
-                    platform_indicator = ""
-                    if tool in tool_manager.BLUESKY_TOOLS:
-                        platform_indicator = " [Bluesky]"
-                    elif tool in tool_manager.X_TOOLS:
-                        platform_indicator = " [X]"
-                    elif tool in tool_manager.COMMON_TOOLS:
-                        platform_indicator = " [Common]"
-                    print(f"  - {tool}{platform_indicator}")
+                lines = [f"  - {tool}{_TOOL_TAGS.get(tool, '')}" for tool in sorted(tools)]
+                sys.stdout.write(f"\nCurrently attached tools ({len(tools)}):\n" + "\n".join(lines) + "\n")
         except SystemExit:
             pass
-        finally:
-            sys.stdout = old_stdout
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         
         # Verify output contains tool names
         assert 'search_bluesky_posts' in output
@@ -649,20 +653,14 @@ class TestToolManagerCLI:
     @patch('tool_manager.ensure_platform_tools')
     def test_cli_ensure_bluesky_tools(self, mock_ensure_platform_tools):
         """Test CLI ensure Bluesky tools functionality."""
-        import sys
         
         try:
             # Simulate CLI call
-            import tool_manager
-            import argparse
             sys.argv = ['tool_manager.py', 'bluesky']
             # Execute the CLI code directly
-            parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-            parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-            parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-            parser.add_argument("--list", action="store_true", help="List current tools without making changes")
+            parser = _CACHED_PARSER
             
-            args = parser.parse_args(['bluesky'])
+            args = _parse(('bluesky',))
             
             if not args.list:
                 if not args.platform:
@@ -674,79 +672,17 @@ class TestToolManagerCLI:
         # Verify function was called
         mock_ensure_platform_tools.assert_called_once_with('bluesky', None)
     
-    def test_cli_main_block_coverage(self):
-        """Test CLI main block coverage by running as subprocess."""
-        import subprocess
-        import sys
-        import os
-        
-        # Create a temporary script that imports and runs the main block
-        script_content = '''
-import sys
-sys.path.insert(0, ".")
-from tool_manager import *
-import argparse
-
-# Execute the main block code
-parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-parser.add_argument("--list", action="store_true", help="List current tools without making changes")
-
-args = parser.parse_args(['--list'])
-
-if args.list:
-    tools = set()  # Mock empty tools for coverage
-    print(f"\\nCurrently attached tools ({len(tools)}):")
-    for tool in sorted(tools):
-        platform_indicator = ""
-        if tool in BLUESKY_TOOLS:
-            platform_indicator = " [Bluesky]"
-        elif tool in X_TOOLS:
-            platform_indicator = " [X]"
-        elif tool in COMMON_TOOLS:
-            platform_indicator = " [Common]"
-        print(f"  - {tool}{platform_indicator}")
-else:
-    if not args.platform:
-        parser.error("platform is required when not using --list")
-    # Mock function call for coverage
-    print("ensure_platform_tools called")
-'''
-        
-        # Write script to temporary file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script_content)
-            script_path = f.name
-        
-        try:
-            # Run the script
-            result = subprocess.run([sys.executable, script_path], 
-                                  capture_output=True, text=True, timeout=10)
-            # Should succeed (exit code 0)
-            assert result.returncode == 0
-        finally:
-            # Clean up
-            os.unlink(script_path)
-    
     @patch('tool_manager.ensure_platform_tools')
     def test_cli_ensure_x_tools_with_agent_id(self, mock_ensure_platform_tools):
         """Test CLI ensure X tools with custom agent ID."""
-        import sys
         
         try:
             # Simulate CLI call
-            import tool_manager
-            import argparse
             sys.argv = ['tool_manager.py', 'x', '--agent-id', 'custom-agent-id']
             # Execute the CLI code directly
-            parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-            parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-            parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-            parser.add_argument("--list", action="store_true", help="List current tools without making changes")
+            parser = _CACHED_PARSER
             
-            args = parser.parse_args(['x', '--agent-id', 'custom-agent-id'])
+            args = _parse(('x', '--agent-id', 'custom-agent-id'))
             
             if not args.list:
                 if not args.platform:
@@ -760,8 +696,6 @@ else:
     
     def test_cli_no_platform_error(self):
         """Test CLI error when no platform is specified."""
-        import sys
-        from io import StringIO
         
         # Capture stderr
         old_stderr = sys.stderr
@@ -769,16 +703,11 @@ else:
         
         try:
             # Simulate CLI call without platform
-            import tool_manager
-            import argparse
             sys.argv = ['tool_manager.py']
             # Execute the CLI code directly
-            parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-            parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-            parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-            parser.add_argument("--list", action="store_true", help="List current tools without making changes")
+            parser = _CACHED_PARSER
             
-            args = parser.parse_args([])
+            args = _parse(())
             
             if not args.list:
                 if not args.platform:
@@ -797,7 +726,7 @@ else:
     @patch('tool_manager.get_letta_config')
     @patch('tool_manager.get_agent_config')
     @patch('tool_manager.get_attached_tools')
-    def test_cli_main_execution_list(self, mock_get_attached_tools, mock_get_agent_config, mock_get_letta_config, mock_letta_class):
+    def test_cli_main_execution_list(self, mock_get_attached_tools, mock_get_agent_config, mock_get_letta_config, mock_letta_class, capsys):
         """Test CLI main execution with --list flag."""
         # Setup mocks
         mock_get_letta_config.return_value = {
@@ -817,52 +746,32 @@ else:
         }
         
         # Test CLI main execution by running the actual main block code
-        import sys
-        from io import StringIO
-        
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
-        
         try:
             # Execute the main block code directly
-            import argparse
+            parser = _CACHED_PARSER
             
-            parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-            parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-            parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-            parser.add_argument("--list", action="store_true", help="List current tools without making changes")
-            
-            args = parser.parse_args(['--list'])
+            args = _parse(('--list',))
             
             if args.list:
                 tools = mock_get_attached_tools(args.agent_id)
-                print(f"\nCurrently attached tools ({len(tools)}):")
-                for tool in sorted(tools):
-                    platform_indicator = ""
-                    if tool in BLUESKY_TOOLS:
-                        platform_indicator = " [Bluesky]"
-                    elif tool in X_TOOLS:
-                        platform_indicator = " [X]"
-                    elif tool in COMMON_TOOLS:
-                        platform_indicator = " [Common]"
-                    print(f"  - {tool}{platform_indicator}")
+                lines = [f"  - {tool}{_TOOL_TAGS.get(tool, '')}" for tool in sorted(tools)]
+                sys.stdout.write(f"\nCurrently attached tools ({len(tools)}):\n" + "\n".join(lines) + "\n")
             else:
                 if not args.platform:
                     parser.error("platform is required when not using --list")
                 mock_ensure_platform_tools(args.platform, args.agent_id)
         except SystemExit:
             pass
-        finally:
-            sys.stdout = old_stdout
         
-        output = captured_output.getvalue()
+        output = capsys.readouterr().out
         
         # Verify output contains tool names
         assert 'search_bluesky_posts' in output
         assert 'halt_activity' in output
         assert '[Bluesky]' in output
         assert '[Common]' in output
+        # Listed in sorted order, as the CLI prints them
+        assert output.index('halt_activity') < output.index('search_bluesky_posts')
     
     @patch('tool_manager.Letta')
     @patch('tool_manager.get_letta_config')
@@ -881,31 +790,16 @@ else:
             'name': 'test-agent'
         }
         
-        import sys
-        
         try:
             # Execute the main block code directly
-            import argparse
-            
-            parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-            parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-            parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-            parser.add_argument("--list", action="store_true", help="List current tools without making changes")
+            parser = _CACHED_PARSER
             
-            args = parser.parse_args(['bluesky'])
+            args = _parse(('bluesky',))
             
             if args.list:
                 tools = get_attached_tools(args.agent_id)
-                print(f"\nCurrently attached tools ({len(tools)}):")
-                for tool in sorted(tools):
-                    platform_indicator = ""
-                    if tool in BLUESKY_TOOLS:
-                        platform_indicator = " [Bluesky]"
-                    elif tool in X_TOOLS:
-                        platform_indicator = " [X]"
-                    elif tool in COMMON_TOOLS:
-                        platform_indicator = " [Common]"
-                    print(f"  - {tool}{platform_indicator}")
+                lines = [f"  - {tool}{_TOOL_TAGS.get(tool, '')}" for tool in sorted(tools)]
+                sys.stdout.write(f"\nCurrently attached tools ({len(tools)}):\n" + "\n".join(lines) + "\n")
             else:
                 if not args.platform:
                     parser.error("platform is required when not using --list")
@@ -916,58 +810,13 @@ else:
         # Verify function was called
         mock_ensure_platform_tools.assert_called_once_with('bluesky', None)
     
-    def test_cli_main_block_coverage(self):
-        """Test CLI main block coverage by running as subprocess."""
-        import subprocess
-        import sys
-        import os
-        
-        # Create a temporary script that imports and runs the main block
-        script_content = '''
-import sys
-sys.path.insert(0, ".")
-from tool_manager import *
-import argparse
+    def test_cli_main_block_coverage(self, capsys, monkeypatch):
+        """Test CLI main block coverage by calling main() in-process."""
 
-# Execute the main block code
-parser = argparse.ArgumentParser(description="Manage platform-specific tools for Void agent")
-parser.add_argument("platform", choices=['bluesky', 'x'], nargs='?', help="Platform to configure tools for")
-parser.add_argument("--agent-id", help="Agent ID (default: from config)")
-parser.add_argument("--list", action="store_true", help="List current tools without making changes")
+        mock_get_attached_tools = Mock(return_value=set())
+        monkeypatch.setattr(tool_manager, 'get_attached_tools', mock_get_attached_tools)
+        monkeypatch.setattr('sys.argv', ['tool_manager.py', '--list'])
+        tool_manager.main()
 
-args = parser.parse_args(['--list'])
-
-if args.list:
-    tools = set()  # Mock empty tools for coverage
-    print(f"\\nCurrently attached tools ({len(tools)}):")
-    for tool in sorted(tools):
-        platform_indicator = ""
-        if tool in BLUESKY_TOOLS:
-            platform_indicator = " [Bluesky]"
-        elif tool in X_TOOLS:
-            platform_indicator = " [X]"
-        elif tool in COMMON_TOOLS:
-            platform_indicator = " [Common]"
-        print(f"  - {tool}{platform_indicator}")
-else:
-    if not args.platform:
-        parser.error("platform is required when not using --list")
-    # Mock function call for coverage
-    print("ensure_platform_tools called")
-'''
-        
-        # Write script to temporary file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script_content)
-            script_path = f.name
-        
-        try:
-            # Run the script
-            result = subprocess.run([sys.executable, script_path], 
-                                  capture_output=True, text=True, timeout=10)
-            # Should succeed (exit code 0)
-            assert result.returncode == 0
-        finally:
-            # Clean up
-            os.unlink(script_path)
\ No newline at end of file
+        mock_get_attached_tools.assert_called_once_with(None)
+        assert "Currently attached tools (0):" in capsys.readouterr().out
@@ -1,8 +1,176 @@
 import pytest
-from unittest.mock import Mock, patch
+import responses
 from platforms.bluesky.tools.feed import FeedArgs, get_bluesky_feed
 
 
+PDS_XRPC = "https://bsky.social/xrpc"
+SESSION_URL = f"{PDS_XRPC}/com.atproto.server.createSession"
+TIMELINE_URL = f"{PDS_XRPC}/app.bsky.feed.getTimeline"
+CUSTOM_FEED_URL = f"{PDS_XRPC}/app.bsky.feed.getFeed"
+
+# Canonical payloads shared by the tests; responses serializes them, so sharing needs no copies
+SESSION_JSON_NO_JWT = {
+    'did': 'test_did',
+    'handle': 'test.user.bsky.social'
+    # Missing 'accessJwt'
+}
+
+EMPTY_FEED = {'feed': []}
+
+SINGLE_POST_FEED = {
+    'feed': [
+        {
+            'post': {
+                'uri': 'at://did:plc:test/post/1',
+                'cid': 'test_cid',
+                'record': {
+                    'text': 'Home timeline post',
+                    'createdAt': '2025-01-01T00:00:00.000Z'
+                },
+                'author': {
+                    'handle': 'test.user.bsky.social',
+                    'displayName': 'Test User'
+                },
+                'likeCount': 5,
+                'repostCount': 2,
+                'replyCount': 1
+            }
+        }
+    ]
+}
+
+DISCOVER_FEED = {
+    'feed': [
+        {
+            'post': {
+                'uri': 'at://did:plc:test/post/1',
+                'cid': 'test_cid',
+                'record': {
+                    'text': 'Discover feed post',
+                    'createdAt': '2025-01-01T00:00:00.000Z'
+                },
+                'author': {
+                    'handle': 'popular.user.bsky.social',
+                    'displayName': 'Popular User'
+                },
+                'likeCount': 10,
+                'repostCount': 5,
+                'replyCount': 3
+            }
+        }
+    ]
+}
+
+REPOST_FEED = {
+    'feed': [
+        {
+            'post': {
+                'uri': 'at://did:plc:test/post/1',
+                'cid': 'test_cid',
+                'record': {
+                    'text': 'Reposted content',
+                    'createdAt': '2025-01-01T00:00:00.000Z'
+                },
+                'author': {
+                    'handle': 'original.user.bsky.social',
+                    'displayName': 'Original User'
+                },
+                'likeCount': 5,
+                'repostCount': 2,
+                'replyCount': 1
+            },
+            'reason': {
+                '$type': 'app.bsky.feed.defs#reasonRepost',
+                'by': {
+                    'handle': 'reposter.user.bsky.social',
+                    'displayName': 'Reposter User'
+                }
+            }
+        }
+    ]
+}
+
+REPLY_FEED = {
+    'feed': [
+        {
+            'post': {
+                'uri': 'at://did:plc:test/post/1',
+                'cid': 'test_cid',
+                'record': {
+                    'text': 'Reply content',
+                    'createdAt': '2025-01-01T00:00:00.000Z',
+                    'reply': {
+                        'parent': {
+                            'uri': 'at://did:plc:test/parent/1',
+                            'cid': 'parent_cid'
+                        }
+                    }
+                },
+                'author': {
+                    'handle': 'replier.user.bsky.social',
+                    'displayName': 'Replier User'
+                },
+                'likeCount': 3,
+                'repostCount': 1,
+                'replyCount': 0
+            }
+        }
+    ]
+}
+
+TWO_POST_FEED = {
+    'feed': [
+        {
+            'post': {
+                'uri': 'at://did:plc:test/post/1',
+                'cid': 'test_cid_1',
+                'record': {
+                    'text': 'First post',
+                    'createdAt': '2025-01-01T00:00:00.000Z'
+                },
+                'author': {
+                    'handle': 'user1.bsky.social',
+                    'displayName': 'User One'
+                },
+                'likeCount': 5,
+                'repostCount': 2,
+                'replyCount': 1
+            }
+        },
+        {
+            'post': {
+                'uri': 'at://did:plc:test/post/2',
+                'cid': 'test_cid_2',
+                'record': {
+                    'text': 'Second post',
+                    'createdAt': '2025-01-01T01:00:00.000Z'
+                },
+                'author': {
+                    'handle': 'user2.bsky.social',
+                    'displayName': 'User Two'
+                },
+                'likeCount': 10,
+                'repostCount': 5,
+                'replyCount': 3
+            }
+        }
+    ]
+}
+
+
+def _configure(scenario, bluesky_http, monkeypatch):
+    """Break the shared env/HTTP setup the way an error-path scenario needs; 'ok' leaves it intact."""
+    if scenario == 'no_env':
+        for name in ("BSKY_USERNAME", "BSKY_PASSWORD"):
+            monkeypatch.delenv(name, raising=False)
+    elif scenario == 'bad_session':
+        bluesky_http.replace(responses.POST, SESSION_URL, json={}, status=400)
+    elif scenario == 'no_jwt':
+        bluesky_http.replace(responses.POST, SESSION_URL, json=SESSION_JSON_NO_JWT)
+    elif scenario == 'bad_feed':
+        bluesky_http.replace(responses.GET, TIMELINE_URL, json={}, status=400)
+
+
 class TestFeedArgs:
     def test_feed_args_valid(self):
         """Test FeedArgs with valid data."""
@@ -32,666 +200,120 @@ class TestFeedArgs:
         assert args.max_posts == 10
 
 
+@pytest.mark.usefixtures('bluesky_env', 'bluesky_http')
 class TestGetBlueskyFeed:
-    def test_get_bluesky_feed_home_timeline(self):
+    @pytest.fixture(autouse=True)
+    def _empty_feeds(self, bluesky_http):
+        """Answer both feed endpoints with an empty feed unless a test replaces them."""
+        bluesky_http.add(responses.GET, TIMELINE_URL, json=EMPTY_FEED)
+        bluesky_http.add(responses.GET, CUSTOM_FEED_URL, json=EMPTY_FEED)
+
+    def test_get_bluesky_feed_home_timeline(self, bluesky_http):
         """Test getting home timeline feed."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {
-                    'feed': [
-                        {
-                            'post': {
-                                'uri': 'at://did:plc:test/post/1',
-                                'cid': 'test_cid',
-                                'record': {
-                                    'text': 'Home timeline post',
-                                    'createdAt': '2025-01-01T00:00:00.000Z'
-                                },
-                                'author': {
-                                    'handle': 'test.user.bsky.social',
-                                    'displayName': 'Test User'
-                                },
-                                'likeCount': 5,
-                                'repostCount': 2,
-                                'replyCount': 1
-                            }
-                        }
-                    ]
-                }
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("home")
-                
-                assert "feed:" in result
-                assert "Home timeline post" in result
-                assert "test.user.bsky.social" in result
-                assert "type: home" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_discover_feed(self):
-        """Test getting discover feed."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {
-                    'feed': [
-                        {
-                            'post': {
-                                'uri': 'at://did:plc:test/post/1',
-                                'cid': 'test_cid',
-                                'record': {
-                                    'text': 'Discover feed post',
-                                    'createdAt': '2025-01-01T00:00:00.000Z'
-                                },
-                                'author': {
-                                    'handle': 'popular.user.bsky.social',
-                                    'displayName': 'Popular User'
-                                },
-                                'likeCount': 10,
-                                'repostCount': 5,
-                                'replyCount': 3
-                            }
-                        }
-                    ]
-                }
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("discover")
-                
-                assert "feed:" in result
-                assert "Discover feed post" in result
-                assert "popular.user.bsky.social" in result
-                assert "type: custom" in result
-                assert "name: discover" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_ai_feed(self):
-        """Test getting AI for grownups feed."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("ai-for-grownups")
-                
-                assert "feed:" in result
-                assert "type: custom" in result
-                assert "name: ai-for-grownups" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_atmosphere_feed(self):
-        """Test getting atmosphere feed."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("atmosphere")
-                
-                assert "feed:" in result
-                assert "type: custom" in result
-                assert "name: atmosphere" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_agent_cafe_feed(self):
-        """Test getting agent cafe feed."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("agent-cafe")
-                
-                assert "feed:" in result
-                assert "type: custom" in result
-                assert "name: agent-cafe" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_with_feedname_prefix(self):
-        """Test getting feed with FeedName prefix."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("FeedName.discover")
-                
-                assert "feed:" in result
-                assert "type: custom" in result
-                assert "name: discover" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_invalid_feed_name(self):
-        """Test getting feed with invalid feed name."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with pytest.raises(Exception, match="Invalid feed name 'invalid-feed'"):
-                get_bluesky_feed("invalid-feed")
-
-    def test_get_bluesky_feed_max_posts_capped_at_100(self):
-        """Test that max_posts is capped at 100."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("home", max_posts=150)
-                
-                assert "feed:" in result
-                # Verify that the limit is capped at 100
-                feed_call = mock_get.call_args
-                feed_params = feed_call[1]['params']
-                assert feed_params['limit'] == 100
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_missing_credentials(self):
-        """Test getting feed with missing credentials."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.return_value = None
-            
-            with pytest.raises(Exception, match="BSKY_USERNAME and BSKY_PASSWORD environment variables must be set"):
-                get_bluesky_feed("home")
-
-    def test_get_bluesky_feed_session_error(self):
-        """Test getting feed when session creation fails."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                mock_response = Mock()
-                mock_response.status_code = 400
-                mock_response.raise_for_status.side_effect = Exception("Bad Request")
-                mock_post.return_value = mock_response
-                
-                with pytest.raises(Exception, match="Authentication failed"):
-                    get_bluesky_feed("home")
-
-    def test_get_bluesky_feed_missing_access_token(self):
-        """Test getting feed when session response is missing access token."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation without accessJwt
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                    # Missing 'accessJwt'
-                }
-                mock_post.return_value = mock_session_response
-                
-                with pytest.raises(Exception, match="Failed to get access token from session"):
-                    get_bluesky_feed("home")
-
-    def test_get_bluesky_feed_api_error(self):
-        """Test getting feed when API fails."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock successful session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
+        bluesky_http.replace(responses.GET, TIMELINE_URL, json=SINGLE_POST_FEED)
+
+        result = get_bluesky_feed("home")
+
+        assert "feed:" in result
+        assert "Home timeline post" in result
+        assert "test.user.bsky.social" in result
+        assert "type: home" in result
+
+    def test_get_bluesky_feed_discover_feed_posts(self, bluesky_http):
+        """Test that posts from a custom feed are formatted."""
+        bluesky_http.replace(responses.GET, CUSTOM_FEED_URL, json=DISCOVER_FEED)
+
+        result = get_bluesky_feed("discover")
+
+        assert "feed:" in result
+        assert "Discover feed post" in result
+        assert "popular.user.bsky.social" in result
+
+    @pytest.mark.parametrize('feed_in,name_out,uri_tail', [
+        ('discover', 'discover', 'whats-hot'),
+        ('ai-for-grownups', 'ai-for-grownups', 'ai-for-grownups'),
+        ('atmosphere', 'atmosphere', 'the-atmosphere'),
+        ('agent-cafe', 'agent-cafe', 'agent-cafe'),
+        ('FeedName.discover', 'discover', 'whats-hot'),
+    ])
+    def test_get_bluesky_feed_custom_feeds(self, bluesky_http, feed_in, name_out, uri_tail):
+        """Test that each named preset (with or without the FeedName prefix) resolves to its feed generator."""
+        result = get_bluesky_feed(feed_in)
 
-                # Mock failed feed request
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 400
-                mock_feed_response.raise_for_status.side_effect = Exception("Bad Request")
-                mock_get.return_value = mock_feed_response
-                
-                with pytest.raises(Exception, match="Failed to get feed"):
-                    get_bluesky_feed("home")
+        assert "type: custom" in result
+        assert f"name: {name_out}" in result
+        assert bluesky_http.calls[-1].request.params['feed'].endswith(f"/app.bsky.feed.generator/{uri_tail}")
+
+    def test_get_bluesky_feed_max_posts_capped_at_100(self, bluesky_http):
+        """Test that max_posts is capped at 100."""
+        result = get_bluesky_feed("home", max_posts=150)
+
+        assert "feed:" in result
+        # One session request, then one feed request with the limit capped at 100
+        assert len(bluesky_http.calls) == 2
+        assert bluesky_http.calls[-1].request.params['limit'] == '100'
+
+    @pytest.mark.parametrize('scenario,feed_name,match', [
+        ('ok', 'invalid-feed', "Invalid feed name 'invalid-feed'"),
+        ('no_env', 'home', "BSKY_USERNAME and BSKY_PASSWORD environment variables must be set"),
+        ('bad_session', 'home', "Authentication failed"),
+        ('no_jwt', 'home', "Failed to get access token from session"),
+        ('bad_feed', 'home', "Failed to get feed"),
+    ])
+    def test_get_bluesky_feed_error_paths(self, bluesky_http, monkeypatch, scenario, feed_name, match):
+        """Test that bad feed names, missing credentials, session failures and feed failures are reported."""
+        _configure(scenario, bluesky_http, monkeypatch)
+
+        with pytest.raises(Exception, match=match):
+            get_bluesky_feed(feed_name)
 
     def test_get_bluesky_feed_empty_results(self):
         """Test getting feed with empty results."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock empty feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("home")
-                
-                assert "feed:" in result
-                assert "post_count: 0" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_default_no_feed_name(self):
+        result = get_bluesky_feed("home")
+
+        assert "feed:" in result
+        assert "post_count: 0" in result
+
+    def test_get_bluesky_feed_default_no_feed_name(self, bluesky_http):
         """Test getting feed with no feed name (defaults to home)."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {'feed': []}
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed()
-                
-                assert "feed:" in result
-                assert "type: home" in result
-                assert "name: home" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_with_repost_info(self):
+        result = get_bluesky_feed()
+
+        assert "type: home" in result
+        assert "name: home" in result
+        assert bluesky_http.calls[-1].request.url.startswith(TIMELINE_URL)
+        assert 'feed' not in bluesky_http.calls[-1].request.params
+
+    def test_get_bluesky_feed_with_repost_info(self, bluesky_http):
         """Test getting feed with repost information."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response with repost info
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {
-                    'feed': [
-                        {
-                            'post': {
-                                'uri': 'at://did:plc:test/post/1',
-                                'cid': 'test_cid',
-                                'record': {
-                                    'text': 'Reposted content',
-                                    'createdAt': '2025-01-01T00:00:00.000Z'
-                                },
-                                'author': {
-                                    'handle': 'original.user.bsky.social',
-                                    'displayName': 'Original User'
-                                },
-                                'likeCount': 5,
-                                'repostCount': 2,
-                                'replyCount': 1
-                            },
-                            'reason': {
-                                '$type': 'app.bsky.feed.defs#reasonRepost',
-                                'by': {
-                                    'handle': 'reposter.user.bsky.social',
-                                    'displayName': 'Reposter User'
-                                }
-                            }
-                        }
-                    ]
-                }
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("home")
-                
-                assert "feed:" in result
-                assert "Reposted content" in result
-                assert "reposted_by:" in result
-                assert "reposter.user.bsky.social" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_with_reply_info(self):
+        bluesky_http.replace(responses.GET, TIMELINE_URL, json=REPOST_FEED)
+
+        result = get_bluesky_feed("home")
+
+        assert "feed:" in result
+        assert "Reposted content" in result
+        assert "reposted_by:" in result
+        assert "reposter.user.bsky.social" in result
+
+    def test_get_bluesky_feed_with_reply_info(self, bluesky_http):
         """Test getting feed with reply information."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response with reply info
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {
-                    'feed': [
-                        {
-                            'post': {
-                                'uri': 'at://did:plc:test/post/1',
-                                'cid': 'test_cid',
-                                'record': {
-                                    'text': 'Reply content',
-                                    'createdAt': '2025-01-01T00:00:00.000Z',
-                                    'reply': {
-                                        'parent': {
-                                            'uri': 'at://did:plc:test/parent/1',
-                                            'cid': 'parent_cid'
-                                        }
-                                    }
-                                },
-                                'author': {
-                                    'handle': 'replier.user.bsky.social',
-                                    'displayName': 'Replier User'
-                                },
-                                'likeCount': 3,
-                                'repostCount': 1,
-                                'replyCount': 0
-                            }
-                        }
-                    ]
-                }
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("home")
-                
-                assert "feed:" in result
-                assert "Reply content" in result
-                assert "reply_to:" in result
-                assert "at://did:plc:test/parent/1" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
-
-    def test_get_bluesky_feed_multiple_posts(self):
+        bluesky_http.replace(responses.GET, TIMELINE_URL, json=REPLY_FEED)
+
+        result = get_bluesky_feed("home")
+
+        assert "feed:" in result
+        assert "Reply content" in result
+        assert "reply_to:" in result
+        assert "at://did:plc:test/parent/1" in result
+
+    def test_get_bluesky_feed_multiple_posts(self, bluesky_http):
         """Test getting feed with multiple posts."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                mock_session_response = Mock()
-                mock_session_response.status_code = 200
-                mock_session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'test_did',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = mock_session_response
-
-                # Mock feed response with multiple posts
-                mock_feed_response = Mock()
-                mock_feed_response.status_code = 200
-                mock_feed_response.json.return_value = {
-                    'feed': [
-                        {
-                            'post': {
-                                'uri': 'at://did:plc:test/post/1',
-                                'cid': 'test_cid_1',
-                                'record': {
-                                    'text': 'First post',
-                                    'createdAt': '2025-01-01T00:00:00.000Z'
-                                },
-                                'author': {
-                                    'handle': 'user1.bsky.social',
-                                    'displayName': 'User One'
-                                },
-                                'likeCount': 5,
-                                'repostCount': 2,
-                                'replyCount': 1
-                            }
-                        },
-                        {
-                            'post': {
-                                'uri': 'at://did:plc:test/post/2',
-                                'cid': 'test_cid_2',
-                                'record': {
-                                    'text': 'Second post',
-                                    'createdAt': '2025-01-01T01:00:00.000Z'
-                                },
-                                'author': {
-                                    'handle': 'user2.bsky.social',
-                                    'displayName': 'User Two'
-                                },
-                                'likeCount': 10,
-                                'repostCount': 5,
-                                'replyCount': 3
-                            }
-                        }
-                    ]
-                }
-                mock_get.return_value = mock_feed_response
-
-                result = get_bluesky_feed("home")
-                
-                assert "feed:" in result
-                assert "post_count: 2" in result
-                assert "First post" in result
-                assert "Second post" in result
-                assert "user1.bsky.social" in result
-                assert "user2.bsky.social" in result
-                mock_post.assert_called_once()
-                mock_get.assert_called_once()
\ No newline at end of file
+        bluesky_http.replace(responses.GET, TIMELINE_URL, json=TWO_POST_FEED)
+
+        result = get_bluesky_feed("home")
+
+        assert "feed:" in result
+        assert "post_count: 2" in result
+        assert "First post" in result
+        assert "Second post" in result
+        assert "user1.bsky.social" in result
+        assert "user2.bsky.social" in result
\ No newline at end of file
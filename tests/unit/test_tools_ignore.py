@@ -23,19 +23,18 @@ class TestIgnoreTool:
         
         assert result == f"IGNORED_NOTIFICATION::{category}::{reason}"
     
-    def test_ignore_notification_different_categories(self):
+    @pytest.mark.parametrize("reason,category", [
+        ("Bot detected", "bot"),
+        ("Spam content", "spam"),
+        ("Not relevant", "not_relevant"),
+        ("Handled elsewhere", "handled_elsewhere"),
+        ("Custom category", "custom"),
+    ])
+    def test_ignore_notification_different_categories(self, reason, category):
         """Test ignore notification with different categories."""
-        test_cases = [
-            ("Bot detected", "bot"),
-            ("Spam content", "spam"),
-            ("Not relevant", "not_relevant"),
-            ("Handled elsewhere", "handled_elsewhere"),
-            ("Custom category", "custom")
-        ]
+        result = ignore_notification(reason, category)
         
-        for reason, category in test_cases:
-            result = ignore_notification(reason, category)
-            assert result == f"IGNORED_NOTIFICATION::{category}::{reason}"
+        assert result == f"IGNORED_NOTIFICATION::{category}::{reason}"
     
     def test_ignore_notification_args_model(self):
         """Test IgnoreNotificationArgs Pydantic model."""
@@ -84,14 +83,13 @@ class TestIgnoreTool:
         
         assert result == f"IGNORED_NOTIFICATION::bot::{unicode_reason}"
     
-    def test_ignore_notification_long_reason(self):
-        """Test ignore notification with very long reason."""
-        long_reason = "A" * 1000  # 1000 character reason
-        result = ignore_notification(long_reason)
+    @pytest.mark.parametrize("n", [0, 1, 64])
+    def test_ignore_notification_reason_length(self, n):
+        """Test ignore notification passes reasons of any length through unchanged."""
+        reason = "A" * n
+        result = ignore_notification(reason)
         
-        expected = f"IGNORED_NOTIFICATION::bot::{long_reason}"
-        assert result == expected
-        assert len(result) == len(expected)
+        assert result == f"IGNORED_NOTIFICATION::bot::{reason}"
     
     def test_ignore_notification_empty_reason(self):
         """Test ignore notification with empty reason."""
@@ -105,27 +103,12 @@ class TestIgnoreTool:
         
         assert result == "IGNORED_NOTIFICATION::::Test reason"
     
-    def test_ignore_notification_format_consistency(self):
+    @pytest.mark.parametrize("category", ["bot", "spam", "not_relevant"])
+    @pytest.mark.parametrize("reason", ["Reason 1", "Reason 2", "Reason 3"])
+    def test_ignore_notification_format_consistency(self, reason, category):
         """Test that the output format is consistent."""
-        reasons = ["Reason 1", "Reason 2", "Reason 3"]
-        categories = ["bot", "spam", "not_relevant"]
-        
-        for reason in reasons:
-            for category in categories:
-                result = ignore_notification(reason, category)
-                assert result.startswith("IGNORED_NOTIFICATION::")
-                assert result.endswith(f"::{reason}")
-                assert f"::{category}::" in result
-    
-    def test_ignore_notification_multiple_calls(self):
-        """Test multiple ignore notification calls."""
-        test_data = [
-            ("Bot detected", "bot"),
-            ("Spam content", "spam"),
-            ("Not relevant", "not_relevant")
-        ]
-        
-        results = [ignore_notification(reason, category) for reason, category in test_data]
+        result = ignore_notification(reason, category)
         
-        for i, (reason, category) in enumerate(test_data):
-            assert results[i] == f"IGNORED_NOTIFICATION::{category}::{reason}"
+        assert result.startswith("IGNORED_NOTIFICATION::")
+        assert result.endswith(f"::{reason}")
+        assert f"::{category}::" in result
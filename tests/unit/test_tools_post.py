@@ -1,8 +1,27 @@
 import pytest
-from unittest.mock import Mock, patch
+import requests
+import responses
 from platforms.bluesky.tools.post import PostArgs, create_new_bluesky_post
 
 
+PDS_XRPC = "https://bsky.social/xrpc"
+SESSION_URL = f"{PDS_XRPC}/com.atproto.server.createSession"
+CREATE_RECORD_URL = f"{PDS_XRPC}/com.atproto.repo.createRecord"
+RESOLVE_HANDLE_URL = f"{PDS_XRPC}/com.atproto.identity.resolveHandle"
+
+# Canonical payloads shared by the tests; responses serializes them, so sharing needs no copies
+SESSION_JSON_NO_JWT = {
+    'accessJwt': None,  # Missing token
+    'did': 'did:plc:test',
+    'handle': 'test.user.bsky.social'
+}
+
+CREATED_RECORD = {
+    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
+    'cid': 'test_cid'
+}
+
+
 class TestPostArgs:
     def test_post_args_valid_single_text(self):
         """Test PostArgs with valid single text."""
@@ -33,110 +52,29 @@ class TestPostArgs:
             PostArgs(text=None)
 
 
+@pytest.mark.usefixtures('bluesky_env', 'bluesky_http')
 class TestCreateNewBlueskyPost:
-    def test_create_new_bluesky_post_single_text(self):
-        """Test creating a single Bluesky post."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock post creation
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response]
-                
-                result = create_new_bluesky_post(["Hello from Void!"])
-                
-                assert "Successfully posted to Bluesky!" in result
-                assert "Hello from Void!" in result
-                assert mock_post.call_count == 2  # Session + post creation
-
-    def test_create_new_bluesky_post_thread(self):
-        """Test creating a Bluesky thread."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock post creation responses
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response, post_response, post_response]
-                
-                result = create_new_bluesky_post(["Part 1", "Part 2", "Part 3"])
-                
-                assert "Successfully created thread with 3 posts!" in result
-                assert mock_post.call_count == 4  # Session + 3 posts
-
-    def test_create_new_bluesky_post_custom_language(self):
-        """Test creating a post with custom language."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock post creation
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response]
-                
-                result = create_new_bluesky_post(["Hola mundo!"], lang="es")
-                
-                assert "Successfully posted to Bluesky!" in result
-                assert "Hola mundo!" in result
-                assert "Language: es" in result
+    @pytest.fixture(autouse=True)
+    def _created_record(self, bluesky_http):
+        """Answer every createRecord call with the same post, once per post in a thread."""
+        bluesky_http.add(responses.POST, CREATE_RECORD_URL, json=CREATED_RECORD)
+
+    @pytest.mark.parametrize("texts,lang,needles", [
+        (["Hello from Void!"], "en-US", ("Successfully posted to Bluesky!", "Hello from Void!")),
+        (["Hola mundo!"], "es", ("Successfully posted to Bluesky!", "Hola mundo!")),
+        (["Part 1", "Part 2"], "en-US", ("Successfully created thread with 2 posts!",)),
+        (["Part 1", "Part 2", "Part 3"], "en-US", ("Successfully created thread with 3 posts!",)),
+        # No thread length limit in the current implementation
+        ([f"Post {i}" for i in range(6)], "en-US", ("Successfully created thread with 6 posts!",)),
+    ], ids=["single_text", "custom_language", "thread_of_2", "thread_of_3", "thread_of_6"])
+    def test_create_new_bluesky_post_success(self, bluesky_http, texts, lang, needles):
+        """Test creating single posts and threads."""
+        result = create_new_bluesky_post(texts, lang=lang)
+
+        for needle in needles:
+            assert needle in result
+        assert f"Language: {lang}" in result
+        assert len(bluesky_http.calls) == 1 + len(texts)  # Session + one createRecord per post
 
     def test_create_new_bluesky_post_empty_text_raises_exception(self):
         """Test creating a post with empty text list raises exception."""
@@ -149,255 +87,60 @@ class TestCreateNewBlueskyPost:
         with pytest.raises(Exception, match="Post 1 exceeds 300 character limit"):
             create_new_bluesky_post([long_text])
 
-    def test_create_new_bluesky_post_missing_credentials(self):
+    def test_create_new_bluesky_post_missing_credentials(self, monkeypatch):
         """Test creating a post with missing credentials."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.return_value = None
-            
-            with pytest.raises(Exception, match="BSKY_USERNAME and BSKY_PASSWORD environment variables must be set"):
-                create_new_bluesky_post(["Test post"])
+        for name in ('BSKY_USERNAME', 'BSKY_PASSWORD'):
+            monkeypatch.delenv(name, raising=False)
+
+        with pytest.raises(Exception, match="BSKY_USERNAME and BSKY_PASSWORD environment variables must be set"):
+            create_new_bluesky_post(["Test post"])
 
-    def test_create_new_bluesky_post_api_error(self):
+    def test_create_new_bluesky_post_api_error(self, bluesky_http):
         """Test creating a post when API returns error."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                mock_response = Mock()
-                mock_response.status_code = 400
-                mock_response.raise_for_status.side_effect = Exception("Bad Request")
-                mock_post.return_value = mock_response
-                
-                with pytest.raises(Exception, match="Error posting to Bluesky"):
-                    create_new_bluesky_post(["Test post"])
-
-    def test_create_new_bluesky_post_network_error(self):
+        bluesky_http.replace(responses.POST, SESSION_URL, json={'error': 'Bad Request'}, status=400)
+
+        with pytest.raises(Exception, match="Error posting to Bluesky"):
+            create_new_bluesky_post(["Test post"])
+
+    def test_create_new_bluesky_post_network_error(self, bluesky_http):
         """Test creating a post when network request fails."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                mock_post.side_effect = Exception("Network error")
-                
-                with pytest.raises(Exception, match="Error posting to Bluesky"):
-                    create_new_bluesky_post(["Test post"])
-
-    def test_create_new_bluesky_post_thread_too_many_posts(self):
-        """Test creating a thread with too many posts."""
-        texts = [f"Post {i}" for i in range(6)]  # 6 posts, max is 5
-        
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock post creation responses
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response] + [post_response] * 6
-                
-                result = create_new_bluesky_post(texts)
-                
-                # Should succeed (no limit in current implementation)
-                assert "Successfully created thread with 6 posts!" in result
-
-    def test_create_new_bluesky_post_thread_with_reply_to(self):
-        """Test creating a thread with reply_to context."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock post creation responses
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response, post_response]
-                
-                result = create_new_bluesky_post(["Part 1", "Part 2"])
-                
-                assert "Successfully created thread with 2 posts!" in result
-                assert mock_post.call_count == 3  # Session + 2 posts
-
-    def test_create_new_bluesky_post_missing_session_data(self):
+        bluesky_http.replace(responses.POST, SESSION_URL, body=requests.ConnectionError("Network error"))
+
+        with pytest.raises(Exception, match="Error posting to Bluesky"):
+            create_new_bluesky_post(["Test post"])
+
+    def test_create_new_bluesky_post_missing_session_data(self, bluesky_http):
         """Test creating a post when session response is missing required data."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation with missing data
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': None,  # Missing token
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                mock_post.return_value = session_response
-                
-                with pytest.raises(Exception, match="Failed to get access token or DID from session"):
-                    create_new_bluesky_post(["Test post"])
-
-    def test_create_new_bluesky_post_with_mentions(self):
+        bluesky_http.replace(responses.POST, SESSION_URL, json=SESSION_JSON_NO_JWT)
+
+        with pytest.raises(Exception, match="Failed to get access token or DID from session"):
+            create_new_bluesky_post(["Test post"])
+
+    def test_create_new_bluesky_post_with_mentions(self, bluesky_http):
         """Test creating a post with mentions."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock mention resolution
-                mention_response = Mock()
-                mention_response.status_code = 200
-                mention_response.json.return_value = {
-                    'did': 'did:plc:mentioned_user'
-                }
-                mock_get.return_value = mention_response
-                
-                # Mock post creation
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response]
-                
-                result = create_new_bluesky_post(["Hello @test.user.bsky.social!"])
-                
-                assert "Successfully posted to Bluesky!" in result
-                assert "@test.user.bsky.social" in result
-                # Verify mention resolution was called
-                mock_get.assert_called_once()
+        bluesky_http.add(responses.GET, RESOLVE_HANDLE_URL, json={'did': 'did:plc:mentioned_user'})
+
+        result = create_new_bluesky_post(["Hello @test.user.bsky.social!"])
+
+        assert "Successfully posted to Bluesky!" in result
+        assert "@test.user.bsky.social" in result
+        # Verify mention resolution was called
+        resolve_calls = [call for call in bluesky_http.calls if call.request.method == responses.GET]
+        assert len(resolve_calls) == 1
+        assert resolve_calls[0].request.params == {'handle': 'test.user.bsky.social'}
 
     def test_create_new_bluesky_post_with_urls(self):
         """Test creating a post with URLs."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post:
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock post creation
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response]
-                
-                result = create_new_bluesky_post(["Check out https://example.com!"])
-                
-                assert "Successfully posted to Bluesky!" in result
-                assert "https://example.com" in result
-
-    def test_create_new_bluesky_post_mention_resolution_failure(self):
+        result = create_new_bluesky_post(["Check out https://example.com!"])
+
+        assert "Successfully posted to Bluesky!" in result
+        assert "https://example.com" in result
+
+    def test_create_new_bluesky_post_mention_resolution_failure(self, bluesky_http):
         """Test creating a post when mention resolution fails."""
-        with patch('os.getenv') as mock_getenv:
-            mock_getenv.side_effect = lambda key, default=None: {
-                'BSKY_USERNAME': 'test.user.bsky.social',
-                'BSKY_PASSWORD': 'test_password',
-                'PDS_URI': 'https://bsky.social'
-            }.get(key, default)
-            
-            with patch('requests.post') as mock_post, \
-                 patch('requests.get') as mock_get:
-                
-                # Mock session creation
-                session_response = Mock()
-                session_response.status_code = 200
-                session_response.json.return_value = {
-                    'accessJwt': 'test_token',
-                    'did': 'did:plc:test',
-                    'handle': 'test.user.bsky.social'
-                }
-                
-                # Mock mention resolution failure
-                mock_get.side_effect = Exception("Resolution failed")
-                
-                # Mock post creation
-                post_response = Mock()
-                post_response.status_code = 200
-                post_response.json.return_value = {
-                    'uri': 'at://did:plc:test/app.bsky.feed.post/test',
-                    'cid': 'test_cid'
-                }
-                
-                mock_post.side_effect = [session_response, post_response]
-                
-                result = create_new_bluesky_post(["Hello @nonexistent.user!"])
-                
-                # Should still succeed, just without mention facets
-                assert "Successfully posted to Bluesky!" in result
+        bluesky_http.add(responses.GET, RESOLVE_HANDLE_URL, body=requests.ConnectionError("Resolution failed"))
+
+        result = create_new_bluesky_post(["Hello @nonexistent.user!"])
+
+        # Should still succeed, just without mention facets
+        assert "Successfully posted to Bluesky!" in result
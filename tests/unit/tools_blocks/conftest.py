@@ -0,0 +1,120 @@
+"""
+Shared fixtures for the platforms/bluesky/tools/blocks.py unit tests.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+# Imported at collection time so the specs are the real classes, never a patched Letta
+from letta_client import Letta
+from letta_client.agents.blocks.client import BlocksClient as AgentBlocksClient
+from letta_client.agents.client import AgentsClient
+from letta_client.blocks.client import BlocksClient
+
+import platforms.bluesky.tools.blocks as blocks
+from tests.unit.tools_blocks.helpers import AgentState
+
+
+@pytest.fixture(autouse=True)
+def _clear_blocks_caches():
+    """Keep cached config parses and Letta clients from leaking between tests."""
+    blocks._YAML_CACHE.clear()
+    blocks._CLIENT_CACHE.clear()
+    yield
+    blocks._YAML_CACHE.clear()
+    blocks._CLIENT_CACHE.clear()
+
+
+@pytest.fixture(scope="class")
+def _letta_patchers(class_mocker):
+    """Patch the Letta constructor and config loader once per test class."""
+    return {
+        'letta': class_mocker.patch('letta_client.Letta'),
+        'config': class_mocker.patch('core.config.get_letta_config'),
+    }
+
+
+@pytest.fixture
+def letta_patches(_letta_patchers):
+    """Patch the collaborators the Letta client factories in blocks.py resolve at call time.
+
+    Tests configure the returned mocks via ``.return_value`` / ``.side_effect``
+    instead of patching them themselves. ``letta`` and ``config``
+    are installed once per class and reset after each test.
+    """
+    yield SimpleNamespace(**_letta_patchers)
+    for mock in _letta_patchers.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_client():
+    """Letta client Mock with no blocks, specced against the client classes.
+
+    Letta creates ``agents``/``blocks`` in ``__init__``, so those are attached
+    as Mocks specced against their own client classes.
+    """
+    client = MagicMock(spec=Letta)
+    client.agents = MagicMock(spec=AgentsClient)
+    client.agents.blocks = MagicMock(spec=AgentBlocksClient)
+    client.blocks = MagicMock(spec=BlocksClient)
+    client.agents.blocks.list.return_value = []
+    client.blocks.list.return_value = []
+    return client
+
+
+@pytest.fixture(scope="module")
+def _x_client_patcher(module_mocker):
+    """Patch get_x_letta_client once per test module; see ``get_x_client``."""
+    return module_mocker.patch.object(blocks, 'get_x_letta_client')
+
+
+@pytest.fixture
+def get_x_client(_x_client_patcher, mock_client):
+    """Patched get_x_letta_client that returns ``mock_client``, reset after each test.
+
+    Tests set ``.side_effect`` to exercise the ImportError fallback.
+    """
+    _x_client_patcher.return_value = mock_client
+    yield _x_client_patcher
+    _x_client_patcher.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="class")
+def letta_api_key():
+    """Set LETTA_API_KEY once per test class for the env fallback tests; yields the key."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('LETTA_API_KEY', 'test-key')
+        yield 'test-key'
+
+
+@pytest.fixture
+def x_letta_fallback(get_x_client, mock_client, letta_api_key, monkeypatch):
+    """Force the X tools onto their inline ``Letta(token=LETTA_API_KEY)`` fallback.
+
+    get_x_letta_client raises ImportError; the returned ``Letta`` patch builds
+    ``mock_client``.
+    """
+    get_x_client.side_effect = ImportError("Module not found")
+    letta = Mock(return_value=mock_client)
+    monkeypatch.setattr('letta_client.Letta', letta)
+    return letta
+
+
+@pytest.fixture(scope="session")
+def agent_state():
+    """Agent state stand-in carrying the id the tools read.
+
+    Its ``memory`` is None, so the tools skip their in-memory block sync and
+    never mutate it; tests that exercise the sync use ``failing_sync_agent_state``.
+    """
+    return AgentState(id="test-agent-id")
+
+
+@pytest.fixture
+def failing_sync_agent_state():
+    """Agent state whose ``memory.blocks`` raises on append and iteration, for the sync error paths."""
+    memory_blocks = MagicMock(spec=list)
+    memory_blocks.append.side_effect = Exception("Sync error")
+    memory_blocks.__iter__.side_effect = Exception("Sync error")
+    return AgentState(id="test-agent-id", memory=SimpleNamespace(blocks=memory_blocks))
@@ -0,0 +1,39 @@
+"""
+Plain helpers shared by the platforms/bluesky/tools/blocks.py unit tests.
+"""
+from dataclasses import dataclass
+from typing import Any, Optional
+from unittest.mock import call
+
+
+@dataclass(slots=True)
+class Block:
+    """Plain block record; the tools only read ``id``, ``label`` and ``value``."""
+    id: str
+    label: Optional[str] = None
+    value: Optional[str] = None
+
+
+@dataclass(slots=True)
+class AgentState:
+    """Plain agent state record; ``memory`` is only set for the in-memory sync paths."""
+    id: str
+    memory: Any = None
+
+
+def wire_client(client, found=(), attached=(), created=None):
+    """Wire a client Mock's block lookups in one call and return it.
+
+    ``found`` is what ``blocks.list`` returns, ``attached`` what
+    ``agents.blocks.list`` returns and ``created`` what ``blocks.create`` returns.
+    """
+    client.blocks.list.return_value = list(found)
+    client.agents.blocks.list.return_value = list(attached)
+    if created is not None:
+        client.blocks.create.return_value = created
+    return client
+
+
+def assert_single_call(m, **kw):
+    """Assert a Letta constructor mock was called exactly once, with the given kwargs."""
+    assert m.call_count == 1 and m.call_args == call(**kw), m.call_args_list
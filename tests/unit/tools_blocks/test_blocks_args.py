@@ -0,0 +1,67 @@
+"""
+Unit tests for the tool argument models in platforms/bluesky/tools/blocks.py
+"""
+import re
+import pytest
+from pydantic_core import ValidationError
+import platforms.bluesky.tools.blocks as blocks
+
+pytestmark = pytest.mark.fast
+
+
+_MISSING = re.compile("Field required")
+
+# (model, kwargs, expected exception); None means the kwargs are valid
+CASES = [
+    (blocks.AttachUserBlocksArgs, {'handles': ['user1.bsky.social', 'user2.bsky.social']}, None),
+    (blocks.AttachUserBlocksArgs, {}, ValidationError),
+    (blocks.AttachUserBlocksArgs, {'handles': 'not_a_list'}, ValidationError),
+    (blocks.DetachUserBlocksArgs, {'handles': ['user1.bsky.social', 'user2.bsky.social']}, None),
+    (blocks.DetachUserBlocksArgs, {}, ValidationError),
+    (blocks.UserNoteAppendArgs, {'handle': 'user.bsky.social', 'note': 'This is a note'}, None),
+    (blocks.UserNoteAppendArgs, {'note': 'This is a note'}, ValidationError),
+    (blocks.UserNoteAppendArgs, {'handle': 'user.bsky.social'}, ValidationError),
+    (blocks.UserNoteReplaceArgs, {'handle': 'user.bsky.social', 'old_text': 'old text', 'new_text': 'new text'}, None),
+    (blocks.UserNoteReplaceArgs, {'handle': 'user.bsky.social'}, ValidationError),
+    (blocks.UserNoteSetArgs, {'handle': 'user.bsky.social', 'content': 'Complete content'}, None),
+    (blocks.UserNoteSetArgs, {'handle': 'user.bsky.social'}, ValidationError),
+    (blocks.UserNoteViewArgs, {'handle': 'user.bsky.social'}, None),
+    (blocks.UserNoteViewArgs, {}, ValidationError),
+    (blocks.AttachXUserBlocksArgs, {'user_ids': ['1232326955652931584', '1950680610282094592']}, None),
+    (blocks.AttachXUserBlocksArgs, {}, ValidationError),
+    (blocks.DetachXUserBlocksArgs, {'user_ids': ['1232326955652931584', '1950680610282094592']}, None),
+    (blocks.DetachXUserBlocksArgs, {}, ValidationError),
+    (blocks.XUserNoteAppendArgs, {'user_id': '1232326955652931584', 'note': 'This is a note'}, None),
+    (blocks.XUserNoteAppendArgs, {'note': 'This is a note'}, ValidationError),
+    (blocks.XUserNoteAppendArgs, {'user_id': '1232326955652931584'}, ValidationError),
+]
+
+
+def _case_id(case):
+    model, kwargs, exc = case
+    if exc is None:
+        return f"{model.__name__}-valid"
+    missing = sorted(set(model.model_fields) - set(kwargs))
+    return f"{model.__name__}-missing-{'-'.join(missing)}" if missing else f"{model.__name__}-invalid"
+
+
+class TestArgsModels:
+    @pytest.mark.parametrize("model, kwargs, exc", CASES, ids=[_case_id(case) for case in CASES])
+    def test_args_validation(self, model, kwargs, exc):
+        """Test each Args model stores valid arguments and rejects missing or mistyped ones."""
+        if exc is None:
+            assert model(**kwargs).model_dump() == kwargs
+            return
+        with pytest.raises(exc) as exc_info:
+            model(**kwargs)
+        missing = set(model.model_fields) - set(kwargs)
+        if missing:
+            exc_info.match(_MISSING)
+            locs = [error['loc'] for error in exc_info.value.errors()]
+            assert all((field,) in locs for field in missing)
+
+    def test_args_construction_benchmark(self, benchmark):
+        """Benchmark validated construction of an Args model."""
+        kwargs = {'handle': 'user.bsky.social', 'old_text': 'old text', 'new_text': 'new text'}
+        args = benchmark(blocks.UserNoteReplaceArgs, **kwargs)
+        assert args.model_dump() == kwargs
@@ -0,0 +1,456 @@
+"""
+Unit tests for attaching and detaching user blocks in platforms/bluesky/tools/blocks.py
+"""
+from types import SimpleNamespace
+import pytest
+from unittest.mock import Mock
+import platforms.bluesky.tools.blocks as blocks
+from tests.unit.tools_blocks.helpers import Block, assert_single_call
+
+pytestmark = pytest.mark.fast
+
+
+class TestAttachUserBlocks:
+    def test_attach_user_blocks_success(self, mock_client, agent_state, monkeypatch):
+        """Test successful attachment of user blocks."""
+        # Mock client and blocks
+        mock_block = Block("block-id", "user_test_handle")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        # Mock block creation
+        mock_client.blocks.create.return_value = mock_block
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Block attached" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_attach_user_blocks_sync_error(self, mock_client, failing_sync_agent_state, monkeypatch):
+        """Test attachment with memory sync error."""
+        # Mock client and blocks
+        mock_block = Block("block-id", "user_test_handle")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        # Mock block creation
+        mock_client.blocks.create.return_value = mock_block
+        
+        result = blocks.attach_user_blocks(['test.handle'], failing_sync_agent_state)
+        
+        # Should still succeed despite sync error
+        assert "✓ test.handle: Block attached" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+        assert failing_sync_agent_state.memory.blocks.append.call_count == 1
+
+    def test_attach_user_blocks_already_attached(self, mock_client, agent_state, monkeypatch):
+        """Test attachment when blocks are already attached."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        # Mock current blocks (already attached)
+        mock_client.agents.blocks.list.return_value = [mock_existing_block]
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Already attached" in result
+        mock_client.blocks.create.assert_not_called()
+        mock_client.agents.blocks.attach.assert_not_called()
+
+    def test_attach_user_blocks_bulk_benchmark(self, benchmark, mock_client, agent_state, monkeypatch):
+        """Benchmark attaching 100 new user blocks against the mocked client."""
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        mock_client.blocks.create.return_value = Block("block-id")
+        handles = ['u%d' % i for i in range(100)]
+
+        result = benchmark(blocks.attach_user_blocks, handles, agent_state)
+
+        assert result.count(": Block attached") == 100
+
+    def test_attach_user_blocks_fallback_to_env(self, mock_client, agent_state, monkeypatch, letta_api_key):
+        """Test attachment with environment variable fallback."""
+        monkeypatch.setattr(blocks, 'get_letta_client', Mock(side_effect=ImportError("Module not found")))
+        
+        mock_letta_class = Mock(return_value=mock_client)
+        monkeypatch.setattr('letta_client.Letta', mock_letta_class)
+        
+        # Mock block creation
+        mock_client.blocks.create.return_value = Block("block-id")
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Block attached" in result
+        assert_single_call(mock_letta_class, token=letta_api_key)
+
+
+class TestDetachUserBlocks:
+    def test_detach_user_blocks_success(self, mock_client, agent_state, monkeypatch):
+        """Test successful detachment of user blocks."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        # Mock current blocks (attached)
+        mock_client.agents.blocks.list.return_value = [mock_existing_block]
+        
+        result = blocks.detach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Detached" in result
+        assert mock_client.agents.blocks.detach.call_count == 1
+
+    def test_detach_user_blocks_syncs_memory(self, mock_client, monkeypatch):
+        """Test detachment drops only the detached block from the agent's memory."""
+        detached = Block("existing-block-id", "user_test_handle")
+        kept = Block("other-block-id", "user_other_handle")
+        agent_state = SimpleNamespace(id="test-agent-id", memory=SimpleNamespace(blocks=[kept, detached]))
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        mock_client.agents.blocks.list.return_value = [detached]
+        
+        result = blocks.detach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Detached" in result
+        assert agent_state.memory.blocks == [kept]
+
+    def test_detach_user_blocks_sync_error(self, mock_client, failing_sync_agent_state, monkeypatch, capsys):
+        """Test a memory sync failure is logged without failing the detachment."""
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        mock_client.agents.blocks.list.return_value = [Block("existing-block-id", "user_test_handle")]
+        
+        result = blocks.detach_user_blocks(['test.handle'], failing_sync_agent_state)
+        
+        assert "✓ test.handle: Detached" in result
+        assert "Could not sync block user_test_handle removal from agent memory: Sync error" in capsys.readouterr().out
+
+    def test_detach_user_blocks_not_attached(self, mock_client, agent_state, monkeypatch):
+        """Test detachment when blocks are not attached."""
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        result = blocks.detach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✗ test.handle: Not attached" in result
+        mock_client.agents.blocks.detach.assert_not_called()
+
+    def test_detach_user_blocks_import_error(self, mock_client, agent_state, monkeypatch, letta_api_key):
+        """Test detach user blocks with ImportError fallback."""
+        monkeypatch.setattr(blocks, 'get_letta_client', Mock(side_effect=ImportError("Module not found")))
+        
+        mock_letta_class = Mock(return_value=mock_client)
+        monkeypatch.setattr('letta_client.Letta', mock_letta_class)
+        
+        result = blocks.detach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✗ test.handle: Not attached" in result
+        assert_single_call(mock_letta_class, token=letta_api_key)
+
+    def test_detach_user_blocks_detachment_error(self, mock_client, agent_state, monkeypatch):
+        """Test detach user blocks with detachment error."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle")
+
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+
+        # Mock current blocks (attached)
+        mock_client.agents.blocks.list.return_value = [mock_existing_block]
+
+        # Mock detachment error
+        mock_client.agents.blocks.detach.side_effect = Exception("Detachment failed")
+
+        result = blocks.detach_user_blocks(['test.handle'], agent_state)
+
+        assert "Error during detachment - Detachment failed" in result
+        assert "test.handle" in result
+
+    def test_detach_user_blocks_outer_exception(self, mock_client, agent_state, monkeypatch):
+        """Test detach user blocks outer exception handling."""
+        # Mock client that raises exception on agents.blocks.list
+        mock_client.agents.blocks.list.side_effect = Exception("Outer error")
+
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+
+        with pytest.raises(Exception) as exc_info:
+            blocks.detach_user_blocks(['test.user'], agent_state)
+
+        msg = str(exc_info.value)
+        assert "Error detaching user blocks" in msg
+        assert "Outer error" in msg
+
+
+class TestAttachUserBlocksErrorHandling:
+    def test_attach_user_blocks_block_already_attached_by_id(self, mock_client, agent_state, monkeypatch):
+        """Test attachment when block is already attached by ID."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle")
+        
+        # Mock current blocks (block already attached by ID)
+        mock_attached_block = Block("existing-block-id", "user_different_user")  # Same ID as the existing block
+        mock_client.agents.blocks.list.return_value = [mock_attached_block]
+        
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Already attached (by ID)" in result
+        mock_client.blocks.create.assert_not_called()
+        mock_client.agents.blocks.attach.assert_not_called()
+
+    def test_attach_user_blocks_outer_exception(self, mock_client, agent_state, monkeypatch):
+        """Test attach user blocks outer exception handling."""
+        # Mock client that raises exception on agents.blocks.list
+        mock_client.agents.blocks.list.side_effect = Exception("Outer error")
+
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+
+        with pytest.raises(Exception) as exc_info:
+            blocks.attach_user_blocks(['test.user'], agent_state)
+
+        msg = str(exc_info.value)
+        assert "Error attaching user blocks" in msg
+        assert "Outer error" in msg
+
+    def test_attach_user_blocks_duplicate_constraint_error(self, mock_client, agent_state, monkeypatch):
+        """Test attachment with duplicate constraint error handling."""
+        # Mock block creation
+        mock_new_block = Block("new-block-id")
+        mock_client.blocks.create.return_value = mock_new_block
+        
+        # Mock duplicate constraint error
+        mock_client.agents.blocks.attach.side_effect = Exception("duplicate key value violates unique constraint unique_label_per_agent")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✓ test.handle: Already attached (verified)" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_attach_user_blocks_other_attach_error(self, mock_client, agent_state, monkeypatch):
+        """Test attachment with other attach error."""
+        # Mock block creation
+        mock_new_block = Block("new-block-id")
+        mock_client.blocks.create.return_value = mock_new_block
+        
+        # Mock other attach error
+        mock_client.agents.blocks.attach.side_effect = Exception("Network error")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✗ test.handle: Error - Network error" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_attach_user_blocks_block_creation_error(self, mock_client, agent_state, monkeypatch):
+        """Test attachment with block creation error."""
+        # Mock block creation error
+        mock_client.blocks.create.side_effect = Exception("Block creation failed")
+        
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+        
+        result = blocks.attach_user_blocks(['test.handle'], agent_state)
+        
+        assert "✗ test.handle: Error - Block creation failed" in result
+        assert mock_client.blocks.create.call_count == 1
+        mock_client.agents.blocks.attach.assert_not_called()
+
+    def test_attach_user_blocks_existing_block_not_attached_by_id(self, mock_client, agent_state, monkeypatch):
+        """Test attach user blocks when block exists but is not attached by ID."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_user")
+
+        # Mock current blocks (different block attached)
+        mock_attached_block = Block("different-block-id", "user_different_user")
+        mock_client.agents.blocks.list.return_value = [mock_attached_block]
+
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+
+        monkeypatch.setattr(blocks, 'get_letta_client', lambda: mock_client)
+
+        result = blocks.attach_user_blocks(['test.user'], agent_state)
+
+        # Verify result contains "Block attached"
+        assert "Block attached" in result
+        assert "test.user" in result
+
+        # Verify attachment was attempted
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+
+@pytest.mark.usefixtures("get_x_client")
+class TestAttachXUserBlocks:
+    def test_attach_x_user_blocks_success(self, mock_client, agent_state):
+        """Test successful attachment of X user blocks."""
+        # Mock client and blocks
+        mock_block = Block("block-id", "x_user_123456789")
+        
+        # Mock block creation
+        mock_client.blocks.create.return_value = mock_block
+            
+        result = blocks.attach_x_user_blocks(['123456789'], agent_state)
+            
+        assert "✓ 123456789: Block attached" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_attach_x_user_blocks_sync_error(self, mock_client, failing_sync_agent_state):
+        """Test X attachment with memory sync error."""
+        # Mock client and blocks
+        mock_block = Block("block-id", "x_user_123456789")
+        
+        # Mock block creation
+        mock_client.blocks.create.return_value = mock_block
+            
+        result = blocks.attach_x_user_blocks(['123456789'], failing_sync_agent_state)
+            
+        # Should still succeed despite sync error
+        assert "✓ 123456789: Block attached" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+        assert failing_sync_agent_state.memory.blocks.append.call_count == 1
+
+    def test_attach_x_user_blocks_block_creation_error(self, mock_client, agent_state):
+        """Test attach X user blocks with block creation error."""
+        # Mock client
+        mock_client.blocks.create.side_effect = Exception("Block creation failed")
+
+        result = blocks.attach_x_user_blocks(['123456789'], agent_state)
+
+        assert "Error - Block creation failed" in result
+        assert "123456789" in result
+
+    def test_attach_x_user_blocks_outer_exception(self, mock_client, agent_state):
+        """Test attach X user blocks outer exception handling."""
+        # Mock client that raises exception on agents.blocks.list
+        mock_client.agents.blocks.list.side_effect = Exception("Outer error")
+
+        with pytest.raises(Exception) as exc_info:
+            blocks.attach_x_user_blocks(['123456789'], agent_state)
+
+        msg = str(exc_info.value)
+        assert "Error attaching X user blocks" in msg
+        assert "Outer error" in msg
+
+
+@pytest.mark.usefixtures("get_x_client")
+class TestDetachXUserBlocks:
+    def test_detach_x_user_blocks_success(self, mock_client, agent_state):
+        """Test successful detachment of X user blocks."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "x_user_123456789")
+        
+        # Mock current blocks (attached)
+        mock_client.agents.blocks.list.return_value = [mock_existing_block]
+            
+        result = blocks.detach_x_user_blocks(['123456789'], agent_state)
+            
+        assert "✓ 123456789: Detached" in result
+        assert mock_client.agents.blocks.detach.call_count == 1
+
+    def test_detach_x_user_blocks_syncs_memory(self, mock_client):
+        """Test X detachment drops only the detached block from the agent's memory."""
+        detached = Block("existing-block-id", "x_user_123456789")
+        kept = Block("other-block-id", "x_user_987654321")
+        agent_state = SimpleNamespace(id="test-agent-id", memory=SimpleNamespace(blocks=[kept, detached]))
+        mock_client.agents.blocks.list.return_value = [detached]
+        
+        result = blocks.detach_x_user_blocks(['123456789'], agent_state)
+        
+        assert "✓ 123456789: Detached" in result
+        assert agent_state.memory.blocks == [kept]
+
+    def test_detach_x_user_blocks_sync_error(self, mock_client, failing_sync_agent_state, capsys):
+        """Test an X memory sync failure is logged without failing the detachment."""
+        mock_client.agents.blocks.list.return_value = [Block("existing-block-id", "x_user_123456789")]
+        
+        result = blocks.detach_x_user_blocks(['123456789'], failing_sync_agent_state)
+        
+        assert "✓ 123456789: Detached" in result
+        assert "Could not sync block x_user_123456789 removal from agent memory: Sync error" in capsys.readouterr().out
+
+    def test_detach_x_user_blocks_detachment_error(self, mock_client, agent_state):
+        """Test detach X user blocks with detachment error."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "x_user_123456789")
+
+        # Mock current blocks (attached)
+        mock_client.agents.blocks.list.return_value = [mock_existing_block]
+
+        # Mock detachment error
+        mock_client.agents.blocks.detach.side_effect = Exception("Detachment failed")
+
+        result = blocks.detach_x_user_blocks(['123456789'], agent_state)
+
+        assert "Error during detachment - Detachment failed" in result
+        assert "123456789" in result
+
+    def test_detach_x_user_blocks_outer_exception(self, mock_client, agent_state):
+        """Test detach X user blocks outer exception handling."""
+        # Mock client that raises exception on agents.blocks.list
+        mock_client.agents.blocks.list.side_effect = Exception("Outer error")
+
+        with pytest.raises(Exception) as exc_info:
+            blocks.detach_x_user_blocks(['123456789'], agent_state)
+
+        msg = str(exc_info.value)
+        assert "Error detaching X user blocks" in msg
+        assert "Outer error" in msg
+
+
+@pytest.mark.usefixtures("get_x_client")
+class TestAttachXUserBlocksCoverage:
+    """Additional tests to achieve 100% coverage for attach_x_user_blocks"""
+
+    def test_attach_x_user_blocks_already_attached(self, mock_client, agent_state):
+        """Test attach_x_user_blocks skips already attached blocks"""
+        # Mock client and existing block
+        mock_existing_block = Block(None, "x_user_user1")
+        mock_client.agents.blocks.list.return_value = [mock_existing_block]
+        
+        # Mock blocks list for user2 (not attached)
+        mock_block = Block("block-id", "x_user_user2")
+        mock_client.blocks.create.return_value = mock_block
+
+        result = blocks.attach_x_user_blocks(['user1', 'user2'], agent_state)
+            
+        # Should skip user1 (already attached) and process user2
+        assert "✓ user1: Already attached" in result
+        assert "✓ user2: Block attached" in result
+
+    def test_attach_x_user_blocks_existing_block_found(self, mock_client, agent_state):
+        """Test attach_x_user_blocks uses existing block when found"""
+        # Mock existing block found
+        mock_existing_block = Block("existing-block-id", "x_user_user1")
+        mock_client.blocks.list.return_value = [mock_existing_block]
+
+        result = blocks.attach_x_user_blocks(['user1'], agent_state)
+            
+        # Should use existing block
+        assert "✓ user1: Block attached" in result
+        mock_client.blocks.create.assert_not_called()
+
+
+@pytest.mark.usefixtures("get_x_client")
+class TestXUserBlocksImportError:
+    @pytest.mark.parametrize("fn, expected", [
+        (blocks.attach_x_user_blocks, "✓ 123456789: Block attached"),
+        (blocks.detach_x_user_blocks, "✗ 123456789: Not attached"),
+    ], ids=["attach", "detach"])
+    def test_import_error_fallback(self, fn, expected, mock_client, agent_state, x_letta_fallback, letta_api_key):
+        """Test the X attach/detach tools fall back to an inline client on ImportError."""
+        mock_block = Block("block-id", "x_user_123456789")
+        mock_client.blocks.create.return_value = mock_block
+
+        result = fn(['123456789'], agent_state)
+
+        assert expected in result
+        assert_single_call(x_letta_fallback, token=letta_api_key)
@@ -0,0 +1,249 @@
+"""
+Unit tests for the Letta client factories in platforms/bluesky/tools/blocks.py
+"""
+import os
+from pathlib import Path
+from types import SimpleNamespace
+import pytest
+import yaml
+import platforms.bluesky.tools.blocks as blocks
+from tests.unit.tools_blocks.helpers import assert_single_call
+
+pytestmark = pytest.mark.fast
+
+
+class TestGetLettaClient:
+    def test_get_letta_client_with_config(self, letta_patches):
+        """Test getting Letta client with config file."""
+        letta_patches.config.return_value = {
+            'api_key': 'test-api-key',
+            'timeout': 30,
+            'base_url': 'https://api.example.com'
+        }
+        
+        result = blocks.get_letta_client()
+        
+        assert result is letta_patches.letta.return_value
+        assert_single_call(
+            letta_patches.letta,
+            token='test-api-key',
+            timeout=30,
+            base_url='https://api.example.com'
+        )
+
+    def test_get_letta_client_without_base_url(self, letta_patches):
+        """Test getting Letta client without base_url."""
+        letta_patches.config.return_value = {
+            'api_key': 'test-api-key',
+            'timeout': 30
+        }
+        
+        blocks.get_letta_client()
+        
+        assert_single_call(letta_patches.letta, token='test-api-key', timeout=30)
+
+    def test_get_letta_client_passes_explicit_none_timeout(self, letta_patches):
+        """Test a timeout configured as None is still passed to Letta."""
+        letta_patches.config.return_value = {
+            'api_key': 'test-api-key',
+            'timeout': None
+        }
+        
+        blocks.get_letta_client()
+        
+        assert_single_call(letta_patches.letta, token='test-api-key', timeout=None)
+
+    def test_get_letta_client_construction_error_raises(self, letta_patches):
+        """Test a failing Letta constructor surfaces from the factory call itself."""
+        letta_patches.config.return_value = {
+            'api_key': 'test-api-key',
+            'timeout': 30
+        }
+        letta_patches.letta.side_effect = ValueError("bad base_url")
+        
+        with pytest.raises(ValueError, match="bad base_url"):
+            blocks.get_letta_client()
+
+    def test_get_letta_client_is_cached(self, letta_patches):
+        """Test the Letta client is constructed once and then reused."""
+        letta_patches.config.return_value = {
+            'api_key': 'test-api-key',
+            'timeout': 30
+        }
+        
+        first = blocks.get_letta_client()
+        second = blocks.get_letta_client()
+        
+        assert first is second
+        assert letta_patches.letta.call_count == 1
+
+    def test_get_letta_client_fallback_to_env(self, letta_patches, letta_api_key):
+        """Test getting Letta client falling back to environment variable."""
+        letta_patches.config.side_effect = FileNotFoundError("Config not found")
+        
+        blocks.get_letta_client()
+        
+        assert_single_call(letta_patches.letta, token=letta_api_key)
+
+
+@pytest.fixture
+def x_config(tmp_path, monkeypatch):
+    """Run from an empty tmp_path and return where config/platforms.yaml belongs."""
+    (tmp_path / "config").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "config" / "platforms.yaml"
+
+
+@pytest.fixture
+def mock_letta(mocker):
+    """Patch the Letta constructor so the X factory builds a Mock instead of a real client."""
+    return mocker.patch('letta_client.Letta')
+
+
+class TestGetXLettaClient:
+    def test_get_x_letta_client_with_config(self, x_config, mock_letta):
+        """Test getting X Letta client with config/platforms.yaml."""
+        x_config.write_text(
+            "letta:\n  api_key: x-api-key\n  timeout: 600\n  base_url: https://x-api.example.com\n"
+        )
+        
+        result = blocks.get_x_letta_client()
+        
+        assert result is mock_letta.return_value
+        assert_single_call(
+            mock_letta,
+            token='x-api-key',
+            timeout=600,
+            base_url='https://x-api.example.com'
+        )
+
+    def test_get_x_letta_client_uses_injected_loader(self, x_config, mocker, mock_letta):
+        """Test an injected loader is handed the config path instead of parsing it."""
+        x_config.write_text("")
+        loader = mocker.Mock(return_value={'letta': {'api_key': 'x-api-key'}})
+        
+        blocks.get_x_letta_client(_loader=loader)
+        
+        loader.assert_called_once_with(Path("config/platforms.yaml"))
+        assert_single_call(mock_letta, token='x-api-key', timeout=600)
+
+    def test_get_x_letta_client_parses_real_yaml(self, x_config, mocker, mock_letta):
+        """Test the X config is parsed with the C-accelerated safe loader when available."""
+        x_config.write_text("letta:\n  api_key: x-api-key\n  timeout: 600\n")
+        yaml_load = mocker.spy(yaml, 'load')
+        
+        blocks.get_x_letta_client()
+        
+        assert_single_call(mock_letta, token='x-api-key', timeout=600)
+        assert yaml_load.call_args.kwargs['Loader'] is getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    def test_get_x_letta_client_reuses_cached_config(self, x_config, mocker, mock_letta):
+        """Test an unchanged config file is parsed once across calls."""
+        x_config.write_text("letta:\n  api_key: x-api-key\n")
+        yaml_load = mocker.spy(yaml, 'load')
+        
+        first = blocks.get_x_letta_client()
+        second = blocks.get_x_letta_client()
+        
+        assert yaml_load.call_count == 1
+        assert first is second
+        assert mock_letta.call_count == 1
+
+    def test_get_x_letta_client_reloads_changed_config(self, x_config, mocker, mock_letta):
+        """Test a config file with a new mtime is parsed again and yields a new client."""
+        mock_letta.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+        x_config.write_text("letta:\n  api_key: x-api-key\n")
+        yaml_load = mocker.spy(yaml, 'load')
+        
+        first = blocks.get_x_letta_client()
+        x_config.write_text("letta:\n  api_key: y-api-key\n")
+        mtime = x_config.stat().st_mtime + 10
+        os.utime(x_config, (mtime, mtime))
+        second = blocks.get_x_letta_client()
+        
+        assert yaml_load.call_count == 2
+        assert first.token == 'x-api-key'
+        assert second.token == 'y-api-key'
+        assert blocks.get_x_letta_client() is second
+
+    def test_get_x_letta_client_picks_up_config_created_later(self, x_config, mocker, mock_letta):
+        """Test the fallback client is not kept once config/platforms.yaml appears."""
+        mock_get_client = mocker.patch.object(blocks, 'get_letta_client')
+        
+        fallback = blocks.get_x_letta_client()
+        x_config.write_text("letta:\n  api_key: x-api-key\n")
+        result = blocks.get_x_letta_client()
+        
+        assert fallback is mock_get_client.return_value
+        assert result is mock_letta.return_value
+        assert mock_get_client.call_count == 1
+
+    def test_get_x_letta_client_config_not_exists(self, x_config, mocker):
+        """Test getting X Letta client when config doesn't exist."""
+        mock_get_client = mocker.patch.object(blocks, 'get_letta_client')
+        
+        result = blocks.get_x_letta_client()
+        
+        assert result == mock_get_client.return_value
+        assert mock_get_client.call_count == 1
+
+    def test_get_x_letta_client_yaml_error(self, x_config, mocker):
+        """Test getting X Letta client with YAML error."""
+        x_config.write_text("letta: [unclosed\n")
+        mock_get_client = mocker.patch.object(blocks, 'get_letta_client')
+        
+        result = blocks.get_x_letta_client()
+        
+        assert result == mock_get_client.return_value
+        assert mock_get_client.call_count == 1
+
+
+class TestLoadYamlCached:
+    def test_load_yaml_cached_evicts_oldest_entry(self, tmp_path, monkeypatch):
+        """Test the parse cache drops its least recently used file once it is full."""
+        monkeypatch.setattr(blocks, '_YAML_CACHE_MAXSIZE', 2)
+        paths = []
+        for name in ('a', 'b', 'c'):
+            path = tmp_path / f"{name}.yaml"
+            path.write_text(f"name: {name}\n")
+            paths.append(path)
+        
+        assert [blocks._load_yaml_cached(path) for path in paths] == [
+            {'name': 'a'}, {'name': 'b'}, {'name': 'c'}
+        ]
+        
+        assert list(blocks._YAML_CACHE) == [os.path.abspath(str(path)) for path in paths[1:]]
+
+
+class TestCachedClient:
+    def test_cached_client_evicts_oldest_spec(self, monkeypatch, mocker):
+        """Test the client cache drops its least recently used spec once it is full."""
+        monkeypatch.setattr(blocks, '_CLIENT_CACHE_MAXSIZE', 2)
+        factory = mocker.Mock(side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+        specs = [blocks.LettaClientSpec(token=token) for token in ('a', 'b', 'c')]
+        
+        first, _, _ = [blocks._cached_client(factory, spec) for spec in specs]
+        
+        assert [key[1] for key in blocks._CLIENT_CACHE] == specs[1:]
+        assert blocks._cached_client(factory, specs[0]) is not first
+        assert factory.call_count == 4
+
+
+class TestGetPlatformLettaClient:
+    def test_get_platform_letta_client_bluesky(self, mocker):
+        """Test getting platform client for Bluesky."""
+        mock_get_client = mocker.patch.object(blocks, 'get_letta_client')
+        
+        result = blocks.get_platform_letta_client(is_x_function=False)
+        
+        assert result == mock_get_client.return_value
+        assert mock_get_client.call_count == 1
+
+    def test_get_platform_letta_client_x(self, mocker):
+        """Test getting platform client for X."""
+        mock_get_x_client = mocker.patch.object(blocks, 'get_x_letta_client')
+        
+        result = blocks.get_platform_letta_client(is_x_function=True)
+        
+        assert result == mock_get_x_client.return_value
+        assert mock_get_x_client.call_count == 1
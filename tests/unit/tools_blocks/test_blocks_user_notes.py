@@ -0,0 +1,255 @@
+"""
+Unit tests for the Bluesky user note tools in platforms/bluesky/tools/blocks.py
+"""
+import pytest
+import platforms.bluesky.tools.blocks as blocks
+from tests.unit.tools_blocks.helpers import Block, assert_single_call
+
+pytestmark = pytest.mark.fast
+
+
+class TestUserNoteAppend:
+    def test_user_note_append_success(self, mock_client, agent_state, monkeypatch):
+        """Test successful note append."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle", "Existing content")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+        
+        result = blocks.user_note_append('test.handle', 'New note', agent_state)
+        
+        assert "✓ Appended note to test.handle's memory block" in result
+        assert mock_client.blocks.modify.call_count == 1
+
+    def test_user_note_append_not_attached(self, mock_client, agent_state, monkeypatch):
+        """Test note append when block is not attached."""
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        # Mock block list (no existing block)
+        
+        # Mock block creation
+        mock_new_block = Block("new-block-id", "user_test_handle")
+        mock_client.blocks.create.return_value = mock_new_block
+        
+        result = blocks.user_note_append('test.handle', 'New note', agent_state)
+        
+        assert "✓ Created and attached test.handle's memory block with note" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+
+class TestUserNoteReplace:
+    def test_user_note_replace_success(self, mock_client, agent_state, monkeypatch):
+        """Test successful note replace."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle", "Old text content")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+        
+        result = blocks.user_note_replace('test.handle', 'Old text', 'New text', agent_state)
+        
+        assert "✓ Replaced text in test.handle's memory block" in result
+        assert mock_client.blocks.modify.call_count == 1
+
+    def test_user_note_replace_text_not_found(self, mock_client, agent_state, monkeypatch):
+        """Test note replace when old text is not found."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle", "Different content")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+        
+        with pytest.raises(Exception) as exc_info:
+            blocks.user_note_replace('test.handle', 'Old text', 'New text', agent_state)
+        
+        msg = str(exc_info.value)
+        assert "Error replacing text in user block" in msg
+        assert "Text 'Old text' not found in test.handle's memory block" in msg
+        mock_client.blocks.modify.assert_not_called()
+
+    def test_user_note_replace_no_block_found(self, mock_client, agent_state, monkeypatch):
+        """Test user note replace when no block is found."""
+        # Mock block list (no blocks found)
+
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+
+        with pytest.raises(Exception) as exc_info:
+            blocks.user_note_replace('test.handle', 'Old text', 'New text', agent_state)
+
+        msg = str(exc_info.value)
+        assert "Error replacing text in user block" in msg
+        assert "No memory block found for user: test.handle" in msg
+
+
+class TestUserNoteSet:
+    def test_user_note_set_success(self, mock_client, agent_state, monkeypatch):
+        """Test successful note set."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+        
+        result = blocks.user_note_set('test.handle', 'New content', agent_state)
+        
+        assert "✓ Set content for test.handle's memory block" in result
+        assert mock_client.blocks.modify.call_count == 1
+
+
+class TestUserNoteView:
+    def test_user_note_view_success(self, mock_client, agent_state, monkeypatch):
+        """Test successful note view."""
+        # Mock client and existing block
+        mock_existing_block = Block("existing-block-id", "user_test_handle", "Block content")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        # Mock block list (existing block found)
+        mock_client.blocks.list.return_value = [mock_existing_block]
+        
+        result = blocks.user_note_view('test.handle', agent_state)
+        
+        assert "Block content" in result
+        assert "test.handle" in result
+
+
+class TestUserNoteAppendErrorHandling:
+    def test_user_note_append_block_already_attached(self, mock_client, agent_state, monkeypatch):
+        """Test note append when block is already attached to agent."""
+        # Mock block list (no existing block)
+        
+        # Mock block creation
+        mock_new_block = Block("new-block-id", "user_test_handle")
+        mock_client.blocks.create.return_value = mock_new_block
+        
+        # Mock current blocks (already attached)
+        mock_attached_block = Block(None, "user_test_handle")
+        mock_client.agents.blocks.list.return_value = [mock_attached_block]
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        result = blocks.user_note_append('test.handle', 'New note', agent_state)
+        
+        assert "✓ Created test.handle's memory block with note" in result
+        assert mock_client.blocks.create.call_count == 1
+        mock_client.agents.blocks.attach.assert_not_called()
+
+    def test_user_note_append_error_handling(self, mock_client, agent_state, monkeypatch):
+        """Test note append error handling."""
+        # Mock block list error
+        mock_client.blocks.list.side_effect = Exception("Database error")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        with pytest.raises(Exception) as exc_info:
+            blocks.user_note_append('test.handle', 'New note', agent_state)
+        
+        msg = str(exc_info.value)
+        assert "Error appending note to user block" in msg
+        assert "Database error" in msg
+
+
+class TestUserNoteSetErrorHandling:
+    def test_user_note_set_block_creation_and_attachment(self, mock_client, agent_state, monkeypatch):
+        """Test note set with block creation and attachment."""
+        # Mock block list (no existing block)
+        
+        # Mock block creation
+        mock_new_block = Block("new-block-id", "user_test_handle")
+        mock_client.blocks.create.return_value = mock_new_block
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        result = blocks.user_note_set('test.handle', 'New content', agent_state)
+        
+        assert "✓ Created and attached test.handle's memory block" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_user_note_set_block_already_attached(self, mock_client, agent_state, monkeypatch):
+        """Test note set when block is already attached."""
+        # Mock block list (no existing block)
+        
+        # Mock block creation
+        mock_new_block = Block("new-block-id", "user_test_handle")
+        mock_client.blocks.create.return_value = mock_new_block
+        
+        # Mock current blocks (already attached)
+        mock_attached_block = Block(None, "user_test_handle")
+        mock_client.agents.blocks.list.return_value = [mock_attached_block]
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        result = blocks.user_note_set('test.handle', 'New content', agent_state)
+        
+        assert "✓ Created test.handle's memory block" in result
+        assert mock_client.blocks.create.call_count == 1
+        mock_client.agents.blocks.attach.assert_not_called()
+
+    def test_user_note_set_error_handling(self, mock_client, agent_state, monkeypatch):
+        """Test note set error handling."""
+        # Mock block list error
+        mock_client.blocks.list.side_effect = Exception("Database error")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        with pytest.raises(Exception) as exc_info:
+            blocks.user_note_set('test.handle', 'New content', agent_state)
+        
+        msg = str(exc_info.value)
+        assert "Error setting user block content" in msg
+        assert "Database error" in msg
+
+
+class TestUserNoteViewErrorHandling:
+    def test_user_note_view_no_block_found(self, mock_client, agent_state, monkeypatch):
+        """Test note view when no block is found."""
+        # Mock block list (no blocks found)
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        result = blocks.user_note_view('test.handle', agent_state)
+        
+        assert "No memory block found for user: test.handle" in result
+
+    def test_user_note_view_error_handling(self, mock_client, agent_state, monkeypatch):
+        """Test note view error handling."""
+        # Mock block list error
+        mock_client.blocks.list.side_effect = Exception("Database error")
+        
+        monkeypatch.setattr(blocks, 'get_x_letta_client', lambda: mock_client)
+        
+        with pytest.raises(Exception) as exc_info:
+            blocks.user_note_view('test.handle', agent_state)
+        
+        msg = str(exc_info.value)
+        assert "Error viewing user block" in msg
+        assert "Database error" in msg
+
+
+class TestUserNoteImportError:
+    @pytest.mark.parametrize("fn, args, expected", [
+        (blocks.user_note_append, ('New note',), "✓ Appended note to test.handle's memory block"),
+        (blocks.user_note_replace, ('Old text', 'New text'), "✓ Replaced text in test.handle's memory block"),
+        (blocks.user_note_set, ('New content',), "✓ Set content for test.handle's memory block"),
+        (blocks.user_note_view, (), "Old text content"),
+    ], ids=["append", "replace", "set", "view"])
+    def test_import_error_fallback(self, fn, args, expected, mock_client, agent_state, x_letta_fallback, letta_api_key):
+        """Test the user note tools fall back to an inline client on ImportError."""
+        mock_existing_block = Block("existing-block-id", "user_test_handle", "Old text content")
+        mock_client.blocks.list.return_value = [mock_existing_block]
+
+        result = fn('test.handle', *args, agent_state)
+
+        assert expected in result
+        assert_single_call(x_letta_fallback, token=letta_api_key)
@@ -0,0 +1,167 @@
+"""
+Unit tests for the X user note tools in platforms/bluesky/tools/blocks.py
+"""
+import pytest
+import platforms.bluesky.tools.blocks as blocks
+from tests.unit.tools_blocks.helpers import Block, wire_client, assert_single_call
+
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("get_x_client")]
+
+_UID = '123456789'
+_LABEL = f'x_user_{_UID}'
+_BLOCK_ID = 'existing-block-id'
+
+
+@pytest.fixture(scope="module")
+def existing_block():
+    """The tools only read blocks, so one instance is shared by every test that finds it."""
+    return Block(id=_BLOCK_ID, label=_LABEL, value="Old text content")
+
+
+class TestXUserNoteAppend:
+    def test_x_user_note_append_success(self, mock_client, agent_state, existing_block):
+        """Test successful X user note append."""
+        wire_client(mock_client, found=[existing_block])
+
+        result = blocks.x_user_note_append(_UID, 'New note', agent_state)
+            
+        assert f"✓ Appended note to X user {_UID}'s memory block" in result
+        assert mock_client.blocks.modify.call_count == 1
+
+    def test_x_user_note_append_block_creation_and_attachment(self, mock_client, agent_state):
+        """Test X user note append with block creation and attachment."""
+        wire_client(mock_client, created=Block("new-block-id", _LABEL))
+
+        result = blocks.x_user_note_append(_UID, 'New note', agent_state)
+
+        assert f"✓ Created and attached X user {_UID}'s memory block with note" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_x_user_note_append_block_already_attached(self, mock_client, agent_state):
+        """Test X user note append when block is already attached."""
+        wire_client(mock_client, created=Block("new-block-id", _LABEL), attached=[Block(None, _LABEL)])
+
+        result = blocks.x_user_note_append(_UID, 'New note', agent_state)
+
+        assert f"✓ Created X user {_UID}'s memory block with note" in result
+        assert mock_client.blocks.create.call_count == 1
+        mock_client.agents.blocks.attach.assert_not_called()
+
+
+class TestXUserNoteReplace:
+    def test_x_user_note_replace_success(self, mock_client, agent_state, existing_block):
+        """Test successful X user note replace."""
+        wire_client(mock_client, found=[existing_block])
+
+        result = blocks.x_user_note_replace(_UID, 'Old text', 'New text', agent_state)
+            
+        assert f"✓ Replaced text in X user {_UID}'s memory block" in result
+        assert mock_client.blocks.modify.call_count == 1
+
+    def test_x_user_note_replace_text_not_found(self, mock_client, agent_state):
+        """Test X user note replace when old text is not found."""
+        wire_client(mock_client, found=[Block(_BLOCK_ID, _LABEL, "Different content")])
+
+        with pytest.raises(Exception) as exc_info:
+            blocks.x_user_note_replace(_UID, 'Old text', 'New text', agent_state)
+            
+        msg = str(exc_info.value)
+        assert "Error replacing text in X user block" in msg
+        assert f"Text 'Old text' not found in X user {_UID}'s memory block" in msg
+        mock_client.blocks.modify.assert_not_called()
+
+    def test_x_user_note_replace_no_block_found(self, agent_state):
+        """Test X user note replace when no block is found."""
+        # Mock block list (no blocks found)
+        
+        with pytest.raises(Exception) as exc_info:
+            blocks.x_user_note_replace(_UID, 'Old text', 'New text', agent_state)
+            
+        msg = str(exc_info.value)
+        assert "Error replacing text in X user block" in msg
+        assert f"No memory block found for X user: {_UID}" in msg
+
+
+class TestXUserNoteSet:
+    def test_x_user_note_set_success(self, mock_client, agent_state, existing_block):
+        """Test successful X user note set."""
+        wire_client(mock_client, found=[existing_block])
+
+        result = blocks.x_user_note_set(_UID, 'New content', agent_state)
+            
+        assert f"✓ Set content for X user {_UID}'s memory block" in result
+        assert mock_client.blocks.modify.call_count == 1
+
+    def test_x_user_note_set_block_creation_and_attachment(self, mock_client, agent_state):
+        """Test X user note set with block creation and attachment."""
+        wire_client(mock_client, created=Block("new-block-id", _LABEL))
+
+        result = blocks.x_user_note_set(_UID, 'New content', agent_state)
+            
+        assert f"✓ Created and attached X user {_UID}'s memory block" in result
+        assert mock_client.blocks.create.call_count == 1
+        assert mock_client.agents.blocks.attach.call_count == 1
+
+    def test_x_user_note_set_block_already_attached(self, mock_client, agent_state):
+        """Test X user note set when block is already attached."""
+        wire_client(mock_client, created=Block("new-block-id", _LABEL), attached=[Block(None, _LABEL)])
+
+        result = blocks.x_user_note_set(_UID, 'New content', agent_state)
+            
+        assert f"✓ Created X user {_UID}'s memory block" in result
+        assert mock_client.blocks.create.call_count == 1
+        mock_client.agents.blocks.attach.assert_not_called()
+
+
+class TestXUserNoteView:
+    def test_x_user_note_view_success(self, mock_client, agent_state, existing_block):
+        """Test successful X user note view."""
+        wire_client(mock_client, found=[existing_block])
+
+        result = blocks.x_user_note_view(_UID, agent_state)
+            
+        assert "Old text content" in result
+        assert _UID in result
+
+    def test_x_user_note_view_no_block_found(self, agent_state):
+        """Test X user note view when no block is found."""
+        # Mock block list (no blocks found)
+        
+        result = blocks.x_user_note_view(_UID, agent_state)
+            
+        assert f"No memory block found for X user: {_UID}" in result
+
+
+class TestXUserNoteImportError:
+    @pytest.mark.parametrize("fn, args, expected", [
+        (blocks.x_user_note_append, ('New note',), f"✓ Appended note to X user {_UID}'s memory block"),
+        (blocks.x_user_note_replace, ('Old text', 'New text'), f"✓ Replaced text in X user {_UID}'s memory block"),
+        (blocks.x_user_note_set, ('New content',), f"✓ Set content for X user {_UID}'s memory block"),
+        (blocks.x_user_note_view, (), "Old text content"),
+    ], ids=["append", "replace", "set", "view"])
+    def test_import_error_fallback(self, fn, args, expected, mock_client, agent_state, x_letta_fallback, letta_api_key, existing_block):
+        """Test the X user note tools fall back to an inline client on ImportError."""
+        wire_client(mock_client, found=[existing_block])
+
+        result = fn(_UID, *args, agent_state)
+
+        assert expected in result
+        assert_single_call(x_letta_fallback, token=letta_api_key)
+
+
+class TestXUserNoteErrorPaths:
+    @pytest.mark.parametrize("fn, args, prefix", [
+        (blocks.x_user_note_append, ('New note',), "Error appending note to X user block"),
+        (blocks.x_user_note_replace, ('Old text', 'New text'), "Error replacing text in X user block"),
+        (blocks.x_user_note_set, ('New content',), "Error setting X user block content"),
+        (blocks.x_user_note_view, (), "Error viewing X user block"),
+    ], ids=["append", "replace", "set", "view"])
+    def test_block_list_error(self, fn, args, prefix, mock_client, agent_state):
+        """Test the X user note tools wrap a block lookup failure in their own error."""
+        mock_client.blocks.list.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception) as exc_info:
+            fn(_UID, *args, agent_state)
+
+        assert str(exc_info.value) == f"{prefix}: Database error"
@@ -8,7 +8,7 @@ from core.config import get_letta_config, get_agent_config
 logger = logging.getLogger(__name__)
 
 # Define platform-specific tool sets
-BLUESKY_TOOLS = {
+BLUESKY_TOOLS = frozenset({
     'search_bluesky_posts',
     'create_new_bluesky_post',
     'get_bluesky_feed',
@@ -19,9 +19,9 @@ BLUESKY_TOOLS = {
     'user_note_replace',
     'user_note_set',
     'user_note_view',
-}
+})
 
-X_TOOLS = {
+X_TOOLS = frozenset({
     'add_post_to_x_thread',
     'search_x_posts',
     'attach_x_user_blocks',
@@ -30,16 +30,16 @@ X_TOOLS = {
     'x_user_note_replace',
     'x_user_note_set',
     'x_user_note_view',
-}
+})
 
 # Common tools shared across platforms
-COMMON_TOOLS = {
+COMMON_TOOLS = frozenset({
     'halt_activity',
     'ignore_notification',
     'annotate_ack',
     'create_whitewind_blog_post',
     'fetch_webpage',
-}
+})
 
 
 def ensure_platform_tools(platform: str, agent_id: str = None, api_key: str = None) -> None: